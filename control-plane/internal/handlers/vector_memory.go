@@ -36,6 +36,15 @@ type VectorSearchRequest struct {
 	Scope          *string                `json:"scope,omitempty"`
 }
 
+// VectorBatchSearchRequest describes several similarity queries that share
+// top_k, filters and scope.
+type VectorBatchSearchRequest struct {
+	QueryEmbeddings [][]float32            `json:"query_embeddings" binding:"required"`
+	TopK            int                    `json:"top_k"`
+	Filters         map[string]interface{} `json:"filters"`
+	Scope           *string                `json:"scope,omitempty"`
+}
+
 // SetVectorHandler stores or updates a vector embedding.
 func SetVectorHandler(storage MemoryStorage) gin.HandlerFunc {
 	return func(c *gin.Context) {
@@ -204,3 +213,67 @@ func SimilaritySearchHandler(storage MemoryStorage) gin.HandlerFunc {
 		c.JSON(http.StatusOK, results)
 	}
 }
+
+// BatchSimilaritySearchHandler runs several similarity searches in one request.
+// Results are returned as one list per query embedding, in request order.
+func BatchSimilaritySearchHandler(storage MemoryStorage) gin.HandlerFunc {
+	return func(c *gin.Context) {
+		var req VectorBatchSearchRequest
+		if err := c.ShouldBindJSON(&req); err != nil {
+			c.JSON(http.StatusBadRequest, ErrorResponse{
+				Error:   "invalid_request",
+				Message: err.Error(),
+				Code:    http.StatusBadRequest,
+			})
+			return
+		}
+
+		if len(req.QueryEmbeddings) == 0 {
+			c.JSON(http.StatusBadRequest, ErrorResponse{
+				Error:   "invalid_request",
+				Message: "query_embeddings cannot be empty",
+				Code:    http.StatusBadRequest,
+			})
+			return
+		}
+		for _, embedding := range req.QueryEmbeddings {
+			if len(embedding) == 0 {
+				c.JSON(http.StatusBadRequest, ErrorResponse{
+					Error:   "invalid_request",
+					Message: "query_embeddings cannot contain empty embeddings",
+					Code:    http.StatusBadRequest,
+				})
+				return
+			}
+		}
+
+		if req.TopK <= 0 {
+			req.TopK = 10
+		}
+
+		scope, scopeID := resolveScope(c, req.Scope)
+		results := make([][]*types.VectorSearchResult, len(req.QueryEmbeddings))
+		for i, embedding := range req.QueryEmbeddings {
+			hits, err := storage.SimilaritySearch(
+				c.Request.Context(),
+				scope,
+				scopeID,
+				embedding,
+				req.TopK,
+				req.Filters,
+			)
+			if err != nil {
+				logger.Logger.Error().Err(err).Msg("batch vector search failed")
+				c.JSON(http.StatusInternalServerError, ErrorResponse{
+					Error:   "storage_error",
+					Message: err.Error(),
+					Code:    http.StatusInternalServerError,
+				})
+				return
+			}
+			results[i] = hits
+		}
+
+		c.JSON(http.StatusOK, results)
+	}
+}
@@ -0,0 +1,104 @@
+package handlers
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"sync"
+	"testing"
+
+	"github.com/Agent-Field/agentfield/control-plane/pkg/types"
+
+	"github.com/gin-gonic/gin"
+	"github.com/stretchr/testify/require"
+)
+
+type similaritySearchCall struct {
+	scope   string
+	scopeID string
+	topK    int
+	filters map[string]interface{}
+}
+
+// vectorSearchStub answers each query with a single hit keyed by the query's
+// first component, so responses can be matched back to their query.
+type vectorSearchStub struct {
+	*memoryStorageStub
+	mu    sync.Mutex
+	calls []similaritySearchCall
+}
+
+func (m *vectorSearchStub) SimilaritySearch(ctx context.Context, scope, scopeID string, queryEmbedding []float32, topK int, filters map[string]interface{}) ([]*types.VectorSearchResult, error) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.calls = append(m.calls, similaritySearchCall{scope: scope, scopeID: scopeID, topK: topK, filters: filters})
+	return []*types.VectorSearchResult{{
+		Scope:   scope,
+		ScopeID: scopeID,
+		Key:     fmt.Sprintf("hit-%g", queryEmbedding[0]),
+		Score:   float64(queryEmbedding[0]),
+	}}, nil
+}
+
+func newBatchSearchRouter(storage MemoryStorage) *gin.Engine {
+	gin.SetMode(gin.TestMode)
+	router := gin.New()
+	router.POST("/memory/vector/search/batch", BatchSimilaritySearchHandler(storage))
+	return router
+}
+
+func TestBatchSimilaritySearchHandler_RejectsEmptyEmbeddings(t *testing.T) {
+	for _, body := range []string{
+		`{}`,
+		`{"query_embeddings":[]}`,
+		`{"query_embeddings":[[0.1],[]]}`,
+	} {
+		storage := &vectorSearchStub{memoryStorageStub: newMemoryStorageStub()}
+		router := newBatchSearchRouter(storage)
+
+		req := httptest.NewRequest(http.MethodPost, "/memory/vector/search/batch", strings.NewReader(body))
+		req.Header.Set("Content-Type", "application/json")
+		resp := httptest.NewRecorder()
+		router.ServeHTTP(resp, req)
+
+		require.Equal(t, http.StatusBadRequest, resp.Code, body)
+		require.Empty(t, storage.calls, body)
+	}
+}
+
+func TestBatchSimilaritySearchHandler_ReturnsResultsPerQueryInOrder(t *testing.T) {
+	storage := &vectorSearchStub{memoryStorageStub: newMemoryStorageStub()}
+	router := newBatchSearchRouter(storage)
+
+	body := `{
+		"query_embeddings": [[0.3, 1], [0.1, 1], [0.2, 1]],
+		"top_k": 4,
+		"filters": {"namespace": "website-docs"}
+	}`
+	req := httptest.NewRequest(http.MethodPost, "/memory/vector/search/batch", strings.NewReader(body))
+	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("X-Workflow-ID", "wf-7")
+	resp := httptest.NewRecorder()
+	router.ServeHTTP(resp, req)
+
+	require.Equal(t, http.StatusOK, resp.Code)
+
+	var results [][]types.VectorSearchResult
+	require.NoError(t, json.Unmarshal(resp.Body.Bytes(), &results))
+	require.Len(t, results, 3)
+	for i, key := range []string{"hit-0.3", "hit-0.1", "hit-0.2"} {
+		require.Len(t, results[i], 1)
+		require.Equal(t, key, results[i][0].Key)
+	}
+
+	require.Len(t, storage.calls, 3)
+	for _, call := range storage.calls {
+		require.Equal(t, "workflow", call.scope)
+		require.Equal(t, "wf-7", call.scopeID)
+		require.Equal(t, 4, call.topK)
+		require.Equal(t, map[string]interface{}{"namespace": "website-docs"}, call.filters)
+	}
+}
@@ -963,6 +963,7 @@ func (s *AgentFieldServer) setupRoutes() {
 		agentAPI.GET("/memory/list", handlers.ListMemoryHandler(s.storage))
 		agentAPI.POST("/memory/vector/set", handlers.SetVectorHandler(s.storage))
 		agentAPI.POST("/memory/vector/search", handlers.SimilaritySearchHandler(s.storage))
+		agentAPI.POST("/memory/vector/search/batch", handlers.BatchSimilaritySearchHandler(s.storage))
 		agentAPI.POST("/memory/vector/delete", handlers.DeleteVectorHandler(s.storage))
 		agentAPI.DELETE("/memory/vector/namespace", handlers.DeleteNamespaceVectorsHandler(s.storage))
 
@@ -10,6 +10,7 @@ fi
 TARGET=${TARGET:-demo-agent.synthetic_nested}
 BASE_URL=${BASE_URL:-http://host.docker.internal:8080}
 MODE=${MODE:-async}
+HTTP_BACKEND=${HTTP_BACKEND:-aiohttp}
 REQUESTS=${REQUESTS:-200}
 CONCURRENCY=${CONCURRENCY:-16}
 DEPTH=${DEPTH:-0}
@@ -19,7 +20,8 @@ PRINT_FAILURES=${PRINT_FAILURES:-false}
 SAVE_METRICS=${SAVE_METRICS:-}
 POLL_INTERVAL=${POLL_INTERVAL:-0.25}
 MAX_POLL_INTERVAL=${MAX_POLL_INTERVAL:-5.0}
-BACKOFF_MULTIPLIER=${BACKOFF_MULTIPLIER:-1.7}
+BACKOFF_STRATEGY=${BACKOFF_STRATEGY:-decorrelated}
+BACKOFF_MULTIPLIER=${BACKOFF_MULTIPLIER:-1.3}
 EXECUTION_TIMEOUT=${EXECUTION_TIMEOUT:-600}
 REQUEST_TIMEOUT=${REQUEST_TIMEOUT:-60}
 HEADERS=${HEADERS:-}
@@ -30,6 +32,7 @@ SCENARIO_FILE=${SCENARIO_FILE:-}
 
 ARGS=(
   --mode "$MODE"
+  --http-backend "$HTTP_BACKEND"
   --base-url "$BASE_URL"
   --target "$TARGET"
   --requests "$REQUESTS"
@@ -39,6 +42,7 @@ ARGS=(
   --payload-bytes "$PAYLOAD_BYTES"
   --poll-interval "$POLL_INTERVAL"
   --max-poll-interval "$MAX_POLL_INTERVAL"
+  --backoff-strategy "$BACKOFF_STRATEGY"
   --backoff-multiplier "$BACKOFF_MULTIPLIER"
   --execution-timeout "$EXECUTION_TIMEOUT"
   --request-timeout "$REQUEST_TIMEOUT"
@@ -39,21 +39,66 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import math
 import os
+import re
 import random
-import statistics
+import string
 import sys
 import time
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import aiohttp
 import httpx
+import numpy as np
+from multidict import CIMultiDict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional speedup
+    numba = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
 
 SUCCESS_STATUSES = {"success", "succeeded", "completed"}
 FAILURE_STATUSES = {"error", "failed", "timeout", "cancelled"}
+TERMINAL_STATUSES = SUCCESS_STATUSES | FAILURE_STATUSES
+# The batch status endpoint reports "error" when it fails to load an execution
+# (executions themselves never take that status), so it is not terminal there.
+BATCH_TERMINAL_STATUSES = TERMINAL_STATUSES - {"error"}
+
+# Upper bound growth factor for decorrelated jitter (see AWS "Exponential
+# Backoff And Jitter"); each sleep is drawn from [base, previous * factor].
+DECORRELATED_JITTER_FACTOR = 3.0
+
+PERCENTILES = (50, 75, 90, 95, 99)
+# Below this many samples the JIT compile cost outweighs the kernel speedup.
+NUMBA_MIN_SAMPLES = 100_000
+
+PollResult = Tuple[Optional[str], Optional[Dict[str, Any]], Optional[int]]
 
 DEFAULT_METRIC_KEYS = [
     "process_resident_memory_bytes",
@@ -64,6 +109,35 @@ DEFAULT_METRIC_KEYS = [
 ]
 
 
+if orjson is not None:
+    dumps_json = orjson.dumps
+    loads_json = orjson.loads
+    _PRETTY_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=_PRETTY_OPTIONS)
+
+else:
+
+    def dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    loads_json = json.loads
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def write_stdout(blob: bytes) -> None:
+    """Write pre-encoded output without a bytes -> str -> bytes round-trip."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(blob)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
 def parse_header(header: str) -> Tuple[str, str]:
     if ":" in header:
         key, value = header.split(":", 1)
@@ -82,7 +156,7 @@ def load_template(path: Optional[Path]) -> Optional[str]:
     text = path.read_text()
     # Basic validation for JSON-ness after formatting with empty payload
     try:
-        json.loads(text.format(seq=0, depth=0, width=0, payload=""))
+        loads_json(text.format(seq=0, depth=0, width=0, payload=""))
     except Exception as exc:  # pylint: disable=broad-except
         raise SystemExit(
             f"Template at {path} is not valid JSON after formatting: {exc}"
@@ -99,6 +173,24 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--target", required=True, help="Target in node.reasoner form")
     parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Negotiate HTTP/2 and multiplex requests over a few connections "
+        "(httpx backend only; requires the h2 package)",
+    )
+    parser.add_argument(
+        "--event-loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default="auto",
+        help="Event loop implementation (auto uses uvloop when installed)",
+    )
+    parser.add_argument(
+        "--http-backend",
+        choices=["aiohttp", "httpx"],
+        default="aiohttp",
+        help="HTTP client library used to drive load (default aiohttp)",
+    )
     parser.add_argument("--requests", type=int, default=100)
     parser.add_argument("--concurrency", type=int, default=8)
     parser.add_argument(
@@ -126,6 +218,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--header",
         dest="headers",
         action="append",
+        type=parse_header,
         help="Extra header KEY:VALUE",
         default=[],
     )
@@ -153,17 +246,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=5.0,
         help="Max poll interval for async mode",
     )
+    parser.add_argument(
+        "--backoff-strategy",
+        choices=["decorrelated", "exponential"],
+        default="decorrelated",
+        help="Poll backoff: AWS-style decorrelated jitter or multiplicative",
+    )
     parser.add_argument(
         "--backoff-multiplier",
         type=float,
-        default=1.7,
-        help="Exponential backoff multiplier",
+        default=1.3,
+        help="Exponential backoff multiplier (exponential strategy)",
     )
     parser.add_argument(
         "--jitter",
         type=float,
         default=0.2,
-        help="Random jitter applied to poll sleeps (0-1)",
+        help="Random jitter applied to poll sleeps (0-1, exponential strategy)",
     )
     parser.add_argument(
         "--save-metrics", type=Path, help="Optional path to dump metrics JSON"
@@ -178,6 +277,17 @@ def build_parser() -> argparse.ArgumentParser:
         default="/api/v1/executions",
         help="Status endpoint base path",
     )
+    parser.add_argument(
+        "--status-batch-endpoint",
+        default="/api/v1/executions/batch-status",
+        help="Batch status endpoint used to poll many async executions at once",
+    )
+    parser.add_argument(
+        "--status-batch-size",
+        type=int,
+        default=32,
+        help="Max execution IDs per batch status request (0 polls each ID)",
+    )
     parser.add_argument(
         "--async-submit-prefix",
         default="/api/v1/execute/async",
@@ -218,10 +328,251 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+class DriverResponse:
+    """Backend-agnostic view of an HTTP response (status code + raw body)."""
+
+    __slots__ = ("status_code", "content")
+
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return loads_json(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}: {self.text[:256]}")
+
+
+class HttpxDriver:
+    """Thin wrapper around ``httpx.AsyncClient``."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float,
+        verify_ssl: bool,
+        concurrency: int,
+        http2: bool = False,
+    ) -> None:
+        if http2:
+            # Streams are multiplexed, so a handful of connections is enough.
+            pool_size = max(4, concurrency // 16)
+            limits = httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+        else:
+            limits = httpx.Limits(
+                max_connections=concurrency * 4, max_keepalive_connections=concurrency
+            )
+        self._client = httpx.AsyncClient(
+            timeout=timeout, limits=limits, verify=verify_ssl, http2=http2
+        )
+        self.http_versions: Set[str] = set()
+
+    async def post(
+        self,
+        url: str,
+        *,
+        content: bytes,
+        headers: Mapping[str, str],
+        timeout: Optional[float] = None,
+    ) -> DriverResponse:
+        response = await self._client.post(
+            url, content=content, headers=headers, **_httpx_timeout(timeout)
+        )
+        self.http_versions.add(response.http_version)
+        return DriverResponse(response.status_code, response.content)
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> DriverResponse:
+        response = await self._client.get(
+            url, headers=headers, **_httpx_timeout(timeout)
+        )
+        return DriverResponse(response.status_code, response.content)
+
+    @staticmethod
+    def prepare_headers(headers: Dict[str, str]) -> Mapping[str, str]:
+        return httpx.Headers(headers)
+
+    async def head(self, url: str, *, timeout: Optional[float] = None) -> int:
+        response = await self._client.head(url, **_httpx_timeout(timeout))
+        return response.status_code
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _httpx_timeout(timeout: Optional[float]) -> Dict[str, float]:
+    return {} if timeout is None else {"timeout": timeout}
+
+
+@functools.lru_cache(maxsize=None)
+def _aiohttp_timeout(total: Optional[float]) -> Dict[str, aiohttp.ClientTimeout]:
+    # Omit the kwarg entirely for the session default; aiohttp treats an
+    # explicit None as "no timeout".
+    return {} if total is None else {"timeout": aiohttp.ClientTimeout(total=total)}
+
+
+class AiohttpDriver:
+    """Thin wrapper around a single pooled ``aiohttp.ClientSession``."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float,
+        verify_ssl: bool,
+        concurrency: int,
+        http2: bool = False,
+    ) -> None:
+        if http2:
+            raise ValueError(
+                "aiohttp does not support HTTP/2; use --http-backend httpx"
+            )
+        connector = aiohttp.TCPConnector(
+            limit=concurrency * 4,
+            limit_per_host=concurrency * 4,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            ssl=None if verify_ssl else False,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)
+        )
+        self.http_versions: Set[str] = set()
+
+    async def post(
+        self,
+        url: str,
+        *,
+        content: bytes,
+        headers: Mapping[str, str],
+        timeout: Optional[float] = None,
+    ) -> DriverResponse:
+        async with self._session.post(
+            url, data=content, headers=headers, **_aiohttp_timeout(timeout)
+        ) as response:
+            return DriverResponse(response.status, await response.read())
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> DriverResponse:
+        async with self._session.get(
+            url, headers=headers, **_aiohttp_timeout(timeout)
+        ) as response:
+            return DriverResponse(response.status, await response.read())
+
+    @staticmethod
+    def prepare_headers(headers: Dict[str, str]) -> Mapping[str, str]:
+        return CIMultiDict(headers)
+
+    async def head(self, url: str, *, timeout: Optional[float] = None) -> int:
+        async with self._session.head(url, **_aiohttp_timeout(timeout)) as response:
+            return response.status
+
+    async def aclose(self) -> None:
+        await self._session.close()
+
+
+HttpDriver = Any  # HttpxDriver | AiohttpDriver
+
+DRIVERS = {"httpx": HttpxDriver, "aiohttp": AiohttpDriver}
+
+
+def create_driver(
+    backend: str,
+    *,
+    timeout: float,
+    verify_ssl: bool,
+    concurrency: int,
+    http2: bool = False,
+) -> HttpDriver:
+    return DRIVERS[backend](
+        timeout=timeout, verify_ssl=verify_ssl, concurrency=concurrency, http2=http2
+    )
+
+
+if numba is not None:
+
+    @numba.njit(nogil=True)
+    def _moments_kernel(values: np.ndarray) -> Tuple[float, float, float, float]:
+        # Single pass Welford mean/variance plus min/max.
+        mean = 0.0
+        m2 = 0.0
+        low = np.inf
+        high = -np.inf
+        count = 0
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        return mean, m2 / count, low, high
+
+else:
+    _moments_kernel = None
+
+
+def _partition_percentiles(values: np.ndarray) -> np.ndarray:
+    """Linear-interpolated percentiles (same as ``np.percentile``) via selection.
+
+    Only the neighbouring order statistics of each percentile are selected, an
+    O(n) partition instead of ordering the whole buffer.
+    """
+    positions = np.asarray(PERCENTILES, dtype=np.float64) / 100.0 * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    selected = np.partition(values, np.unique(np.concatenate((lower, upper))))
+    weight = positions - lower
+    return selected[lower] + (selected[upper] - selected[lower]) * weight
+
+
+def latency_stats(latencies_ms: np.ndarray) -> Dict[str, Any]:
+    if latencies_ms.size == 0:
+        return {"avg": 0, "stddev": 0, "min": 0, "max": 0, "percentiles": {}}
+    if _moments_kernel is not None and latencies_ms.size >= NUMBA_MIN_SAMPLES:
+        mean, variance, low, high = _moments_kernel(latencies_ms)
+        values = _partition_percentiles(latencies_ms)
+    else:
+        mean, variance = latencies_ms.mean(), latencies_ms.var()
+        low, high = latencies_ms.min(), latencies_ms.max()
+        values = np.percentile(latencies_ms, PERCENTILES)
+    return {
+        "avg": float(mean),
+        "stddev": float(np.sqrt(variance)) if latencies_ms.size > 1 else 0,
+        "min": float(low),
+        "max": float(high),
+        "percentiles": {
+            f"p{pct}": float(value) for pct, value in zip(PERCENTILES, values)
+        },
+    }
+
+
 class Metrics:
-    def __init__(self) -> None:
+    def __init__(self, capacity: int = 1024) -> None:
         self.started_at = time.perf_counter()
-        self.latencies: List[float] = []
+        # Latencies live in a preallocated float64 buffer sized to the run so
+        # recording is an indexed store and summary() slices it without a copy.
+        self._latencies = np.empty(max(capacity, 1), dtype=np.float64)
+        self._latency_count = 0
         self.status_counts: Counter[str] = Counter()
         self.http_codes: Counter[int] = Counter()
         self.exceptions: Counter[str] = Counter()
@@ -237,7 +588,10 @@ class Metrics:
     ) -> None:
         self.total += 1
         if latency is not None and math.isfinite(latency):
-            self.latencies.append(latency)
+            if self._latency_count == self._latencies.size:
+                self._latencies = np.resize(self._latencies, self._latencies.size * 2)
+            self._latencies[self._latency_count] = latency
+            self._latency_count += 1
         if status:
             self.status_counts[status] += 1
         if http_code is not None:
@@ -247,23 +601,16 @@ class Metrics:
 
     def summary(self) -> Dict[str, Any]:
         elapsed = time.perf_counter() - self.started_at
-        latencies = sorted(self.latencies)
-        percentiles = {}
-        for pct in (50, 75, 90, 95, 99):
-            if latencies:
-                idx = int(round((pct / 100.0) * (len(latencies) - 1)))
-                percentiles[f"p{pct}"] = latencies[idx]
+        stats = latency_stats(self._latencies[: self._latency_count] * 1000.0)
         result = {
             "total_requests": self.total,
             "elapsed_sec": elapsed,
             "throughput_rps": self.total / elapsed if elapsed else 0,
-            "latency_ms_avg": statistics.mean(latencies) * 1000 if latencies else 0,
-            "latency_ms_stddev": statistics.pstdev(latencies) * 1000
-            if len(latencies) > 1
-            else 0,
-            "latency_ms_min": min(latencies) * 1000 if latencies else 0,
-            "latency_ms_max": max(latencies) * 1000 if latencies else 0,
-            "latency_ms_percentiles": {k: v * 1000 for k, v in percentiles.items()},
+            "latency_ms_avg": stats["avg"],
+            "latency_ms_stddev": stats["stddev"],
+            "latency_ms_min": stats["min"],
+            "latency_ms_max": stats["max"],
+            "latency_ms_percentiles": stats["percentiles"],
             "status_counts": dict(self.status_counts),
             "http_counts": dict(self.http_codes),
             "exceptions": dict(self.exceptions),
@@ -271,40 +618,88 @@ class Metrics:
         return result
 
 
-def build_payload_factory(args: argparse.Namespace, template: Optional[str]):
-    payload_seed = (
-        os.urandom(max(args.payload_bytes, 1)).hex() if args.payload_bytes > 0 else ""
-    )
+_CONVERSIONS: Dict[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
 
-    def default_body(seq: int) -> Dict[str, Any]:
-        filler = (payload_seed * ((args.payload_bytes // len(payload_seed)) + 1))[
-            : args.payload_bytes
-        ]
-        body: Dict[str, Any] = {
-            "input": {
-                "sequence": seq,
-                "payload": filler,
-            }
-        }
+
+def _format_field(value: Any, spec: Optional[str], conversion: Optional[str]) -> str:
+    if conversion:
+        value = _CONVERSIONS[conversion](value)
+    return format(value, spec or "")
+
+
+def compile_template(template: str, static: Dict[str, Any]) -> Callable[..., str]:
+    """Pre-split a ``str.format`` template so only dynamic fields are rendered.
+
+    Fields present in ``static`` are substituted once up front; the remaining
+    fields are filled per call with a plain list join instead of re-parsing the
+    whole template through ``str.format``.
+    """
+    pieces: List[str] = []
+    slots: List[Tuple[int, str, str, Optional[str]]] = []
+    buffer: List[str] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        buffer.append(literal)
+        if field is None:
+            continue
+        if field in static:
+            buffer.append(_format_field(static[field], spec, conversion))
+        else:
+            pieces.append("".join(buffer))
+            buffer = []
+            slots.append((len(pieces), field, spec or "", conversion))
+            pieces.append("")
+    pieces.append("".join(buffer))
+
+    def render(**values: Any) -> str:
+        out = list(pieces)
+        for idx, field, spec, conversion in slots:
+            out[idx] = _format_field(values[field], spec, conversion)
+        return "".join(out)
+
+    return render
+
+
+FILLER_PATTERN = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-_"
+
+
+def build_filler(size: int) -> str:
+    """Deterministic JSON-safe filler; content is irrelevant, only size matters."""
+    if size <= 0:
+        return ""
+    repeats = -(-size // len(FILLER_PATTERN))
+    return (FILLER_PATTERN * repeats)[:size]
+
+
+def build_payload_factory(
+    args: argparse.Namespace, template: Optional[str]
+) -> Callable[[int], bytes]:
+    """Return ``seq -> serialized request body``.
+
+    Everything except the sequence number is invariant for a run, so the body
+    is serialized once and only the sequence is spliced in per request.
+    """
+    filler = build_filler(args.payload_bytes)
+
+    if template is None:
+        base_input: Dict[str, Any] = {"payload": filler}
         if args.depth > 0:
-            body["input"]["depth"] = args.depth
+            base_input["depth"] = args.depth
         if args.width > 0:
-            body["input"]["width"] = args.width
-        return body
+            base_input["width"] = args.width
+        prefix = b'{"input":{"sequence":'
+        suffix = b"," + dumps_json(base_input)[1:] + b"}"
+
+        def default_body(seq: int) -> bytes:
+            return b"%s%d%s" % (prefix, seq, suffix)
 
-    if template is None:
         return default_body
 
-    def from_template(seq: int) -> Dict[str, Any]:
-        filler = (
-            os.urandom(max(args.payload_bytes, 1)).hex()[: args.payload_bytes]
-            if args.payload_bytes
-            else ""
-        )
-        formatted = template.format(
-            seq=seq, depth=args.depth, width=args.width, payload=filler
-        )
-        return json.loads(formatted)
+    render = compile_template(
+        template, {"depth": args.depth, "width": args.width, "payload": filler}
+    )
+
+    def from_template(seq: int) -> bytes:
+        return render(seq=seq).encode("utf-8")
 
     return from_template
 
@@ -315,7 +710,7 @@ def load_scenarios(args: argparse.Namespace) -> List[Tuple[str, Dict[str, Any]]]
 
     text = args.scenario_file.read_text()
     try:
-        data = json.loads(text)
+        data = loads_json(text)
     except json.JSONDecodeError as exc:
         raise SystemExit(f"Scenario file must contain valid JSON: {exc}") from exc
 
@@ -338,190 +733,399 @@ def load_scenarios(args: argparse.Namespace) -> List[Tuple[str, Dict[str, Any]]]
     return scenarios
 
 
+def compile_metric_pattern(keys: Iterable[str]) -> "re.Pattern[bytes]":
+    """Match ``name{labels} value`` sample lines for the requested metric names."""
+    names = b"|".join(re.escape(key.encode("utf-8")) for key in keys)
+    return re.compile(
+        rb"^[ \t]*(" + names + rb")(?:\{[^}]*\})?[ \t]+(\S+)", re.MULTILINE
+    )
+
+
+def parse_metric_samples(body: bytes, result: Dict[str, Optional[float]]) -> None:
+    """Fill ``result`` with the first sample of each metric found in ``body``.
+
+    A single regex pass over the raw exposition bytes skips comments and
+    unrelated series without materialising a Python string per line.
+    """
+    pattern = compile_metric_pattern(result)
+    for match in pattern.finditer(body):
+        name = match.group(1).decode("utf-8")
+        if result[name] is not None:
+            continue
+        try:
+            result[name] = float(match.group(2))
+        except ValueError:
+            continue
+
+
 async def scrape_metrics(
-    url: Optional[str], keys: Iterable[str], timeout: float, verify_ssl: bool
+    client: HttpDriver,
+    url: Optional[str],
+    keys: Iterable[str],
+    timeout: float,
 ) -> Optional[Dict[str, Optional[float]]]:
     if not url:
         return None
 
     result: Dict[str, Optional[float]] = {key: None for key in keys}
     try:
-        async with httpx.AsyncClient(timeout=timeout, verify=verify_ssl) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            for line in response.text.splitlines():
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.strip().split()
-                if len(parts) < 2:
-                    continue
-                metric_name = parts[0]
-                if "{" in metric_name:
-                    metric_name = metric_name.split("{", 1)[0]
-                if metric_name in result and result[metric_name] is None:
-                    try:
-                        result[metric_name] = float(parts[-1])
-                    except ValueError:
-                        continue
+        response = await client.get(url, timeout=timeout)
+        response.raise_for_status()
+        if result:
+            parse_metric_samples(response.content, result)
     except Exception as exc:  # pylint: disable=broad-except
         return {"error": str(exc)}
 
     return result
 
 
+def poll_sleep(delay: float, args: argparse.Namespace) -> float:
+    """Actual sleep for the current poll delay."""
+    if args.backoff_strategy == "decorrelated":
+        # Decorrelated delays are already randomised.
+        return delay
+    return delay * (1 + random.uniform(-args.jitter, args.jitter))
+
+
+def next_poll_delay(delay: float, args: argparse.Namespace) -> float:
+    """Grow the poll delay, capped at --max-poll-interval."""
+    if args.backoff_strategy == "decorrelated":
+        upper = max(args.poll_interval, delay * DECORRELATED_JITTER_FACTOR)
+        return min(args.max_poll_interval, random.uniform(args.poll_interval, upper))
+    return min(delay * args.backoff_multiplier, args.max_poll_interval)
+
+
+def metric_deltas(
+    pre: Optional[Dict[str, Any]],
+    post: Optional[Dict[str, Any]],
+    keys: Iterable[str],
+) -> Dict[str, Optional[float]]:
+    if not (isinstance(pre, dict) and isinstance(post, dict)):
+        return {key: None for key in keys}
+    deltas: Dict[str, Optional[float]] = {}
+    for key in keys:
+        before, after = pre.get(key), post.get(key)
+        deltas[key] = None if before is None or after is None else after - before
+    return deltas
+
+
 async def wait_for_async_completion(
-    client: httpx.AsyncClient,
+    client: HttpDriver,
+    status_url_base: str,
     execution_id: str,
-    headers: Dict[str, str],
+    headers: Mapping[str, str],
     args: argparse.Namespace,
-) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[int]]:
-    poll_interval = args.poll_interval
-    deadline = time.perf_counter() + args.execution_timeout
-    endpoint = f"{args.base_url.rstrip('/')}{args.async_status_endpoint.rstrip('/')}/{execution_id}"
+) -> PollResult:
+    delay = args.poll_interval
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + args.execution_timeout
+    endpoint = f"{status_url_base}/{execution_id}"
 
     while True:
-        if time.perf_counter() > deadline:
+        if loop.time() > deadline:
             raise asyncio.TimeoutError(
                 f"execution {execution_id} exceeded timeout {args.execution_timeout}s"
             )
 
-        response = await client.get(endpoint, headers=headers)
+        response = await client.get(
+            endpoint, headers=headers, timeout=args.request_timeout
+        )
         try:
             payload = response.json()
         except json.JSONDecodeError:
             payload = None
         if payload:
             status = str(payload.get("status", "")).lower()
-            if status in SUCCESS_STATUSES | FAILURE_STATUSES:
+            if status in TERMINAL_STATUSES:
                 return status, payload, response.status_code
         else:
             status = None
 
-        await asyncio.sleep(
-            poll_interval * (1 + random.uniform(-args.jitter, args.jitter))
-        )
-        poll_interval = min(
-            poll_interval * args.backoff_multiplier, args.max_poll_interval
+        await asyncio.sleep(poll_sleep(delay, args))
+        delay = next_poll_delay(delay, args)
+
+
+class BatchStatusUnsupported(Exception):
+    """Raised when the gateway does not expose the batch status endpoint."""
+
+
+class StatusBatcher:
+    """Coalesce async status polling for all in-flight executions.
+
+    Callers register an execution ID and await a future; a single background
+    task polls the batch status endpoint for up to ``batch_size`` IDs per
+    request and resolves futures once executions reach a terminal state. A
+    failed round trip is logged and the batch retried on the next tick, so
+    each execution only fails on its own timeout. If the endpoint is missing
+    (404/405) every waiter falls back to per-ID polling.
+    """
+
+    def __init__(
+        self,
+        client: HttpDriver,
+        url: str,
+        headers: Mapping[str, str],
+        args: argparse.Namespace,
+        fallback: Callable[[str], Awaitable[PollResult]],
+    ) -> None:
+        self._client = client
+        self._url = url
+        self._headers = headers
+        self._args = args
+        self._fallback = fallback
+        self._pending: Dict[str, "asyncio.Future[PollResult]"] = {}
+        self._wakeup = asyncio.Event()
+        self._registered = 0
+        self._supported = True
+
+    async def wait(self, execution_id: str) -> PollResult:
+        if not self._supported:
+            return await self._fallback(execution_id)
+        future: "asyncio.Future[PollResult]" = (
+            asyncio.get_running_loop().create_future()
         )
+        self._pending[execution_id] = future
+        self._registered += 1
+        self._wakeup.set()
+        try:
+            return await asyncio.wait_for(future, self._args.execution_timeout)
+        except BatchStatusUnsupported:
+            return await self._fallback(execution_id)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(
+                f"execution {execution_id} exceeded timeout "
+                f"{self._args.execution_timeout}s"
+            ) from None
+        finally:
+            self._pending.pop(execution_id, None)
+
+    async def run(self) -> None:
+        args = self._args
+        delay = args.poll_interval
+        seen = 0
+        while self._supported:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            ids = list(self._pending)
+            batches = [
+                ids[i : i + args.status_batch_size]
+                for i in range(0, len(ids), args.status_batch_size)
+            ]
+            resolved = await asyncio.gather(*(self._poll(batch) for batch in batches))
+            if not self._supported:
+                break
+            # Back off only while nothing new is arriving or finishing.
+            if any(resolved) or self._registered != seen:
+                delay = args.poll_interval
+            else:
+                delay = next_poll_delay(delay, args)
+            seen = self._registered
+            await asyncio.sleep(poll_sleep(delay, args))
+
+    async def _poll(self, batch: List[str]) -> int:
+        try:
+            response = await self._client.post(
+                self._url,
+                content=dumps_json({"execution_ids": batch}),
+                headers=self._headers,
+                timeout=self._args.request_timeout,
+            )
+            if response.status_code in (404, 405):
+                self._disable()
+                return 0
+            response.raise_for_status()
+            statuses = response.json()
+        except Exception as err:  # pylint: disable=broad-except
+            print(
+                f"batch status poll for {len(batch)} executions failed, "
+                f"retrying: {err!r}",
+                file=sys.stderr,
+            )
+            return 0
+
+        resolved = 0
+        for execution_id in batch:
+            payload = statuses.get(execution_id) if isinstance(statuses, dict) else None
+            if not payload:
+                continue
+            status = str(payload.get("status", "")).lower()
+            if status in BATCH_TERMINAL_STATUSES:
+                self._resolve(
+                    execution_id, result=(status, payload, response.status_code)
+                )
+                resolved += 1
+        return resolved
+
+    def _resolve(
+        self,
+        execution_id: str,
+        *,
+        result: Optional[PollResult] = None,
+        exc: Optional[BaseException] = None,
+    ) -> None:
+        future = self._pending.pop(execution_id, None)
+        if future is None or future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _disable(self) -> None:
+        self._supported = False
+        for execution_id in list(self._pending):
+            self._resolve(execution_id, exc=BatchStatusUnsupported())
 
 
 async def invoke_request(
     seq: int,
-    client: httpx.AsyncClient,
-    headers: Dict[str, str],
-    payload_factory,
+    client: HttpDriver,
+    submit_url: str,
+    poll_status: Callable[[str], Awaitable[PollResult]],
+    headers: Mapping[str, str],
+    payload_factory: Callable[[int], bytes],
     metrics: Metrics,
     args: argparse.Namespace,
-    semaphore: asyncio.Semaphore,
     failures: List[Dict[str, Any]],
 ) -> None:
-    async with semaphore:
-        body = payload_factory(seq)
-        url = f"{args.base_url.rstrip('/')}{(args.sync_prefix if args.mode == 'sync' else args.async_submit_prefix).rstrip('/')}/{args.target}"
-        start = time.perf_counter()
-        exc: Optional[BaseException] = None
-        final_status: Optional[str] = None
-        http_code: Optional[int] = None
-        payload_snapshot: Optional[Dict[str, Any]] = None
+    body = payload_factory(seq)
+    # Integer nanosecond clock: loop.time() is only millisecond-granular under
+    # uvloop, which is too coarse for request latencies.
+    start_ns = time.perf_counter_ns()
+    exc: Optional[BaseException] = None
+    final_status: Optional[str] = None
+    http_code: Optional[int] = None
+    payload_snapshot: Optional[Dict[str, Any]] = None
 
-        try:
-            response = await client.post(url, json=body, headers=headers)
-            http_code = response.status_code
-            if args.mode == "sync":
-                payload_snapshot = response.json()
-                final_status = str(payload_snapshot.get("status", "")).lower()
+    try:
+        response = await client.post(
+            submit_url, content=body, headers=headers, timeout=args.request_timeout
+        )
+        http_code = response.status_code
+        if args.mode == "sync":
+            payload_snapshot = response.json()
+            final_status = str(payload_snapshot.get("status", "")).lower()
+        else:
+            if response.status_code >= 400:
+                payload_snapshot = safe_json(response)
+                final_status = f"http_{response.status_code}"
             else:
-                if response.status_code >= 400:
-                    payload_snapshot = safe_json(response)
-                    final_status = f"http_{response.status_code}"
+                submission = response.json()
+                exec_id = submission.get("execution_id")
+                if not exec_id:
+                    final_status = "missing_execution_id"
+                    payload_snapshot = submission
                 else:
-                    submission = response.json()
-                    exec_id = submission.get("execution_id")
-                    if not exec_id:
-                        final_status = "missing_execution_id"
-                        payload_snapshot = submission
-                    else:
-                        (
-                            final_status,
-                            payload_snapshot,
-                            poll_code,
-                        ) = await wait_for_async_completion(
-                            client, exec_id, headers, args
-                        )
-                        if poll_code is not None:
-                            http_code = poll_code
-        except Exception as err:  # pylint: disable=broad-except
-            exc = err
-            final_status = "exception"
-            payload_snapshot = {"error": str(err)}
-
-        latency = time.perf_counter() - start
-        metrics.record(
-            latency=latency, status=final_status, http_code=http_code, exc=exc
+                    (
+                        final_status,
+                        payload_snapshot,
+                        poll_code,
+                    ) = await poll_status(exec_id)
+                    if poll_code is not None:
+                        http_code = poll_code
+    except Exception as err:  # pylint: disable=broad-except
+        exc = err
+        final_status = "exception"
+        payload_snapshot = {"error": str(err)}
+
+    latency = (time.perf_counter_ns() - start_ns) / 1e9
+    metrics.record(latency=latency, status=final_status, http_code=http_code, exc=exc)
+    if final_status and final_status not in SUCCESS_STATUSES:
+        failures.append(
+            {
+                "sequence": seq,
+                "status": final_status,
+                "http_status": http_code,
+                "response": payload_snapshot,
+            }
         )
-        if final_status and final_status not in SUCCESS_STATUSES:
-            failures.append(
-                {
-                    "sequence": seq,
-                    "status": final_status,
-                    "http_status": http_code,
-                    "response": payload_snapshot,
-                }
-            )
 
 
-def safe_json(response: httpx.Response) -> Dict[str, Any]:
+def safe_json(response: DriverResponse) -> Dict[str, Any]:
     try:
         return response.json()
     except json.JSONDecodeError:
         return {"raw": response.text[:512]}
 
 
-async def run_load(args: argparse.Namespace) -> Dict[str, Any]:
-    headers = (
-        {key: value for key, value in (parse_header(h) for h in args.headers)}
-        if args.headers
-        else {}
-    )
+async def run_load(args: argparse.Namespace, client: HttpDriver) -> Dict[str, Any]:
+    raw_headers = dict(args.headers)
+    # Bodies are pre-serialised, so the content type has to be set explicitly.
+    if not any(key.lower() == "content-type" for key in raw_headers):
+        raw_headers["Content-Type"] = "application/json"
+    # Normalise once into the backend's native header type so individual
+    # requests skip the per-call dict conversion and case folding.
+    headers = client.prepare_headers(raw_headers)
     payload_factory = build_payload_factory(args, load_template(args.body_template))
-    metrics = Metrics()
-    semaphore = asyncio.Semaphore(args.concurrency)
+    base_url = args.base_url.rstrip("/")
+    submit_prefix = (
+        args.sync_prefix if args.mode == "sync" else args.async_submit_prefix
+    )
+    submit_url = f"{base_url}{submit_prefix.rstrip('/')}/{args.target}"
+    status_url_base = f"{base_url}{args.async_status_endpoint.rstrip('/')}"
+    batch_status_url = f"{base_url}{args.status_batch_endpoint}"
+    metrics = Metrics(args.requests)
     failures: List[Dict[str, Any]] = []
 
-    limits = httpx.Limits(
-        max_connections=args.concurrency * 4, max_keepalive_connections=args.concurrency
-    )
     metric_keys = args.metrics or DEFAULT_METRIC_KEYS
     pre_metrics = await scrape_metrics(
-        args.metrics_url, metric_keys, args.metrics_timeout, args.verify_ssl
+        client, args.metrics_url, metric_keys, args.metrics_timeout
     )
 
-    async with httpx.AsyncClient(
-        timeout=args.request_timeout, limits=limits, verify=args.verify_ssl
-    ) as client:
-        tasks = [
-            invoke_request(
+    # A fixed pool of workers pulls sequence numbers from one shared iterator,
+    # so nothing per-request is materialised up front and memory and scheduler
+    # overhead scale with --concurrency rather than --requests.
+    sequences = iter(range(args.requests))
+
+    async def worker() -> None:
+        for seq in sequences:
+            await invoke_request(
                 seq,
                 client,
+                submit_url,
+                poll_status,
                 headers,
                 payload_factory,
                 metrics,
                 args,
-                semaphore,
                 failures,
             )
-            for seq in range(args.requests)
-        ]
-        await asyncio.gather(*tasks)
+
+    async def poll_single(execution_id: str) -> PollResult:
+        return await wait_for_async_completion(
+            client, status_url_base, execution_id, headers, args
+        )
+
+    poll_status: Callable[[str], Awaitable[PollResult]] = poll_single
+    background: List["asyncio.Task[None]"] = []
+    if args.mode == "async" and args.status_batch_size > 0:
+        batcher = StatusBatcher(client, batch_status_url, headers, args, poll_single)
+        poll_status = batcher.wait
+        background.append(asyncio.create_task(batcher.run()))
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(min(args.concurrency, args.requests))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers + background:
+            task.cancel()
+        await asyncio.gather(*workers, *background, return_exceptions=True)
 
     post_metrics = await scrape_metrics(
-        args.metrics_url, metric_keys, args.metrics_timeout, args.verify_ssl
+        client, args.metrics_url, metric_keys, args.metrics_timeout
     )
 
     summary = metrics.summary()
     summary["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     summary["config"] = {
         "mode": args.mode,
+        "http_backend": args.http_backend,
+        "event_loop": args.event_loop,
+        "http2": args.http2,
         "base_url": args.base_url,
         "target": args.target,
         "requests": args.requests,
@@ -531,7 +1135,9 @@ async def run_load(args: argparse.Namespace) -> Dict[str, Any]:
         "payload_bytes": args.payload_bytes,
         "poll_interval": args.poll_interval,
         "max_poll_interval": args.max_poll_interval,
+        "backoff_strategy": args.backoff_strategy,
         "backoff_multiplier": args.backoff_multiplier,
+        "status_batch_size": args.status_batch_size,
         "execution_timeout": args.execution_timeout,
         "request_timeout": args.request_timeout,
     }
@@ -539,32 +1145,26 @@ async def run_load(args: argparse.Namespace) -> Dict[str, Any]:
     if args.print_failures and failures:
         print("\n--- Failures (truncated) ---")
         for failure in failures[:20]:
-            print(json.dumps(failure, indent=2, default=str))
+            write_stdout(dumps_pretty(failure))
         if len(failures) > 20:
             print(f"... {len(failures) - 20} additional failures suppressed")
     summary["failures"] = failures
+    if args.http2:
+        # ALPN may silently fall back to HTTP/1.1 (e.g. plain-text gateways).
+        summary["http_versions"] = sorted(client.http_versions)
 
     if args.metrics_url:
         summary["metrics"] = {
             "url": args.metrics_url,
             "pre": pre_metrics,
             "post": post_metrics,
-            "delta": {
-                key: (
-                    None
-                    if not isinstance(pre_metrics, dict)
-                    or not isinstance(post_metrics, dict)
-                    else None
-                    if pre_metrics.get(key) is None or post_metrics.get(key) is None
-                    else post_metrics.get(key) - pre_metrics.get(key)
-                )
-                for key in metric_keys
-            },
+            "delta": metric_deltas(pre_metrics, post_metrics, metric_keys),
         }
 
-    if summary["status_counts"].get("exception") == args.requests and summary[
-        "exceptions"
-    ].get("ConnectError"):
+    exceptions = summary["exceptions"]
+    if summary["status_counts"].get("exception") == args.requests and (
+        exceptions.get("ConnectError") or exceptions.get("ClientConnectorError")
+    ):
         summary["note"] = (
             "All requests failed with connection errors. Verify the gateway is reachable at the specified base URL."
         )
@@ -572,6 +1172,49 @@ async def run_load(args: argparse.Namespace) -> Dict[str, Any]:
     return summary
 
 
+async def warm_up(client: HttpDriver, args: argparse.Namespace) -> None:
+    """Open a first connection so the initial scenario skips the handshake."""
+    try:
+        await client.head(args.base_url, timeout=args.request_timeout)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+def clone_args(
+    args: argparse.Namespace, overrides: Dict[str, Any]
+) -> argparse.Namespace:
+    """Shallow-copy ``args`` with scenario overrides applied.
+
+    Mutable list options are copied so one scenario cannot leak changes into
+    the next.
+    """
+    values = dict(vars(args))
+    values["headers"] = list(values.get("headers") or [])
+    values["metrics"] = list(values.get("metrics") or [])
+    values.update(overrides)
+    # Scenario files spell headers as "KEY:VALUE" strings like the CLI does.
+    values["headers"] = [
+        parse_header(header) if isinstance(header, str) else tuple(header)
+        for header in values["headers"]
+    ]
+    return argparse.Namespace(**values)
+
+
+def resolve_event_loop(choice: str) -> str:
+    if choice == "asyncio":
+        return "asyncio"
+    available = uvloop is not None and sys.platform != "win32"
+    if choice == "uvloop" and not available:
+        raise SystemExit("--event-loop uvloop requested but uvloop is not installed")
+    return "uvloop" if available else "asyncio"
+
+
+def run_async(main_coro: Awaitable[Any], event_loop: str) -> Any:
+    if event_loop == "uvloop":
+        return uvloop.run(main_coro)
+    return asyncio.run(main_coro)
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
@@ -584,28 +1227,64 @@ def main() -> None:
     if args.seed is not None:
         random.seed(args.seed)
 
+    args.event_loop = resolve_event_loop(args.event_loop)
     scenarios = load_scenarios(args)
+    known = vars(args)
+    for name, overrides in scenarios:
+        unknown = sorted(key for key in overrides if key not in known)
+        if unknown:
+            raise SystemExit(
+                f"Scenario '{name}' has unknown option(s): {', '.join(unknown)}"
+            )
+
+    scenario_args: List[Tuple[str, argparse.Namespace]] = []
+    for name, overrides in scenarios:
+        try:
+            scenario_args.append((name, clone_args(args, overrides)))
+        except argparse.ArgumentTypeError as exc:
+            raise SystemExit(f"Scenario '{name}': {exc}") from exc
+    pool_concurrency = max(ns.concurrency for _, ns in scenario_args)
+    for name, ns in scenario_args:
+        if ns.http2 and ns.http_backend != "httpx":
+            raise SystemExit(
+                f"Scenario '{name}': --http2 requires --http-backend httpx"
+            )
 
     async def orchestrate() -> List[Dict[str, Any]]:
+        # Connection pools are shared across scenarios (one per backend/TLS
+        # setting) so sweeps do not pay reconnect and pool warmup costs.
+        drivers: Dict[Tuple[str, bool, bool], HttpDriver] = {}
         results: List[Dict[str, Any]] = []
-        for name, overrides in scenarios:
-            scenario_args = argparse.Namespace(**vars(args))
-            for key, value in overrides.items():
-                if hasattr(scenario_args, key):
-                    setattr(scenario_args, key, value)
-            summary = await run_load(scenario_args)
-            summary["scenario"] = name
-            results.append(summary)
+        try:
+            for name, ns in scenario_args:
+                key = (ns.http_backend, ns.verify_ssl, ns.http2)
+                client = drivers.get(key)
+                if client is None:
+                    client = drivers[key] = create_driver(
+                        ns.http_backend,
+                        timeout=ns.request_timeout,
+                        verify_ssl=ns.verify_ssl,
+                        concurrency=pool_concurrency,
+                        http2=ns.http2,
+                    )
+                    await warm_up(client, ns)
+                summary = await run_load(ns, client)
+                summary["scenario"] = name
+                results.append(summary)
+        finally:
+            for client in drivers.values():
+                await client.aclose()
         return results
 
-    results = asyncio.run(orchestrate())
+    results = run_async(orchestrate(), args.event_loop)
 
     output = results[0] if len(results) == 1 else {"scenarios": results}
-    print(json.dumps(output, indent=2, default=str))
+    blob = dumps_pretty(output)
+    write_stdout(blob)
 
     if args.save_metrics:
         args.save_metrics.parent.mkdir(parents=True, exist_ok=True)
-        args.save_metrics.write_text(json.dumps(output, indent=2, default=str))
+        args.save_metrics.write_bytes(blob)
         print(f"Metrics written to {args.save_metrics}")
 
     failed = any(
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import bisect
+import mmap
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -35,14 +37,29 @@ def _sanitize_text(text: str) -> str:
 
 
 def read_text(path: Path) -> str:
-    """Best-effort UTF-8 reader with fallback to latin-1 and sanitization."""
+    """Best-effort UTF-8 reader with fallback to latin-1 and sanitization.
 
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        raw = path.read_text(encoding="latin-1")
+    The file is memory-mapped and decoded straight from the mapping, so the
+    only full-size copy is the returned string; newline translation and null
+    byte stripping only run when the raw bytes need them.
+    """
+
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            has_nulls = mapped.find(b"\x00") != -1
+            has_returns = mapped.find(b"\r") != -1
+            try:
+                raw = str(mapped, "utf-8")
+            except UnicodeDecodeError:
+                raw = str(mapped, "latin-1")
 
-    return _sanitize_text(raw)
+    if has_returns:  # match the universal-newline reads of Path.read_text
+        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+    return _sanitize_text(raw) if has_nulls else raw
 
 
 @dataclass
@@ -64,7 +81,12 @@ def _collect_headings(text: str) -> List[HeadingIndex]:
 
 
 def _newline_positions(text: str) -> List[int]:
-    return [idx for idx, char in enumerate(text) if char == "\n"]
+    positions: List[int] = []
+    idx = text.find("\n")
+    while idx != -1:
+        positions.append(idx)
+        idx = text.find("\n", idx + 1)
+    return positions
 
 
 def _char_to_line(char_idx: int, newline_positions: Sequence[int]) -> int:
@@ -94,8 +116,7 @@ def chunk_markdown_text(
 ) -> List[DocumentChunk]:
     """Chunk raw documentation text while tracking headings + line numbers."""
 
-    cleaned = text.strip()
-    if not cleaned:
+    if not text or text.isspace():
         return []
 
     headings = _collect_headings(text)
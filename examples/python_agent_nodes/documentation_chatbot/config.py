@@ -0,0 +1,60 @@
+"""Environment-derived settings for the doc chatbot, resolved once at import."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+def _optional_path(value: Optional[str]) -> Optional[Path]:
+    return Path(value).expanduser() if value else None
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from the environment; see the README for each variable."""
+
+    # FastEmbed serves the default from the INT8-quantized ONNX export
+    # (qdrant/bge-small-en-v1.5-onnx-q).
+    embed_model: str
+    embed_providers: Optional[Tuple[str, ...]]
+    embed_threads: int
+    embed_batch: int
+    embed_cache_dir: Optional[Path]
+    local_index_dir: Optional[Path]
+    semantic_cache: bool
+    control_plane_url: str
+    control_plane_api_key: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        providers = os.getenv("DOC_EMBED_PROVIDERS", "CPUExecutionProvider")
+        threads = os.getenv("DOC_EMBED_THREADS")
+        # ONNX Runtime otherwise sizes its pool to logical CPUs; half of them
+        # stands in for the physical core count.
+        default_threads = max(1, (os.cpu_count() or 2) // 2)
+        return cls(
+            embed_model=os.getenv("DOC_EMBED_MODEL", "BAAI/bge-small-en-v1.5"),
+            embed_providers=tuple(
+                name.strip() for name in providers.split(",") if name.strip()
+            )
+            or None,
+            embed_threads=int(threads) if threads else default_threads,
+            embed_batch=int(os.getenv("DOC_EMBED_BATCH", "64")),
+            embed_cache_dir=_optional_path(
+                os.getenv("DOC_EMBED_CACHE_DIR", "~/.cache/agentfield/embed")
+            ),
+            local_index_dir=_optional_path(os.getenv("DOC_LOCAL_INDEX_DIR")),
+            semantic_cache=os.getenv("SEMANTIC_CACHE") == "1",
+            control_plane_url=(
+                os.getenv("CONTROL_PLANE_URL") or os.getenv("AGENTFIELD_SERVER") or ""
+            ).rstrip("/"),
+            control_plane_api_key=(
+                os.getenv("CONTROL_PLANE_API_KEY") or os.getenv("AGENTFIELD_API_KEY")
+            ),
+        )
+
+
+CONFIG = Config.from_env()
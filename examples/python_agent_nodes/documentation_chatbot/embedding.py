@@ -2,28 +2,252 @@
 
 from __future__ import annotations
 
-import os
+import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from functools import lru_cache
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 from fastembed import TextEmbedding
 
+from config import CONFIG
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - the persistent cache is optional
+    diskcache = None
+
+# Every embedded string is memoised by SHA-256 of (model, text), so warmups and
+# re-ingesting unchanged documents skip the ONNX forward pass.
+TEXT_CACHE_SIZE = 10_000
+
+# Query embeddings are reused across a QA turn (refinement topics often repeat
+# planner queries), so keep a small LRU of recent ones with a TTL.
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL_SECONDS = 600.0
+
+# Misses in the in-process text cache fall through to an on-disk cache shared
+# across restarts (same SHA-256 keys), so re-ingesting unchanged chunks after a
+# redeploy skips the model too.
+EMBED_DISK_CACHE_BYTES = 1024 * 1024 * 1024
+
+# Query embeddings requested concurrently (e.g. several retrievals in flight)
+# within this window share one model call, up to this many texts.
+QUERY_BATCH_MAX_TEXTS = 32
+QUERY_BATCH_WAIT_SECONDS = 0.005
+
+_model: Optional[TextEmbedding] = None
+_model_lock = threading.Lock()
+_text_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_text_cache_lock = threading.Lock()
+_query_cache: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def _load_model() -> TextEmbedding:
-    model_name = os.getenv("DOC_EMBED_MODEL", "BAAI/bge-small-en-v1.5")
-    return TextEmbedding(model_name=model_name)
+    # Locked so a request racing the background warmup waits for the session
+    # being built instead of building a second one.
+    global _model
+    with _model_lock:
+        if _model is None:
+            providers = CONFIG.embed_providers
+            _model = TextEmbedding(
+                model_name=CONFIG.embed_model,
+                providers=list(providers) if providers else None,
+                threads=CONFIG.embed_threads,
+            )
+        return _model
+
+
+@lru_cache(maxsize=1)
+def _disk_cache():
+    """Persistent embedding cache, or None when unavailable/disabled."""
+
+    if diskcache is None or CONFIG.embed_cache_dir is None:
+        return None
+    return diskcache.Cache(
+        str(CONFIG.embed_cache_dir),
+        size_limit=EMBED_DISK_CACHE_BYTES,
+        eviction_policy="least-recently-used",
+    )
+
+
+def _embed_uncached(texts: List[str]) -> np.ndarray:
+    # ONNX pads each model batch to its longest input, so feed the texts
+    # shortest-first and restore the caller's order afterwards.
+    order = np.argsort([len(text) for text in texts], kind="stable")
+    embedded = _load_model().embed(
+        [texts[i] for i in order], batch_size=CONFIG.embed_batch
+    )
+    sorted_vectors = np.asarray(list(embedded), dtype=np.float32)
+    vectors = np.empty_like(sorted_vectors)
+    vectors[order] = sorted_vectors
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
+
+
+def warm_up() -> None:
+    """Build the ONNX session and run one inference, bypassing the caches.
+
+    A cached warmup text would return without touching the model, leaving
+    the first real request to pay for the load.
+    """
+
+    _embed_uncached(["doc-chatbot warmup"])
+
+
+def _text_key(model_name: str, text: str) -> bytes:
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).digest()
+
+
+def _embed_missing(missing: Dict[bytes, str]) -> Dict[bytes, np.ndarray]:
+    """Embed texts absent from the text cache, via the disk cache when enabled."""
+
+    cache = _disk_cache()
+    found: Dict[bytes, np.ndarray] = {}
+    if cache is not None:
+        for key in missing:
+            blob = cache.get(key)
+            if blob is not None:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+
+    todo = [key for key in missing if key not in found]
+    if todo:
+        vectors = _embed_uncached([missing[key] for key in todo])
+        if cache is not None:
+            with cache.transact():
+                for key, row in zip(todo, vectors):
+                    cache.set(key, row.tobytes())
+        found.update(zip(todo, vectors))
+    return found
 
 
 def embed_texts(texts: Iterable[str]) -> List[List[float]]:
-    """Embed an iterable of strings and return Python lists."""
+    """Embed an iterable of strings and return unit-length Python lists.
+
+    Vectors are L2-normalised here, so cosine similarity anywhere downstream is
+    a plain dot product. Only strings missing from both the in-process and the
+    on-disk cache reach the model, in a single batch.
+    """
+
+    texts = list(texts)
+    if not texts:
+        return []
+
+    keys = [_text_key(CONFIG.embed_model, text) for text in texts]
+    rows: List[Optional[np.ndarray]] = []
+    with _text_cache_lock:
+        for key in keys:
+            row = _text_cache.get(key)
+            if row is not None:
+                _text_cache.move_to_end(key)
+            rows.append(row)
+
+    missing = {key: text for key, text, row in zip(keys, texts, rows) if row is None}
+    if missing:
+        fresh = _embed_missing(missing)
+        with _text_cache_lock:
+            for key, row in fresh.items():
+                _text_cache[key] = row.copy()
+                _text_cache.move_to_end(key)
+            while len(_text_cache) > TEXT_CACHE_SIZE:
+                _text_cache.popitem(last=False)
+        rows = [row if row is not None else fresh[key] for key, row in zip(keys, rows)]
+
+    return np.stack(rows).tolist()
+
+
+class _BatchingEmbedder:
+    """Coalesces concurrent ``embed_texts`` calls into one model batch.
+
+    Requests arriving within ``max_wait`` of the first queued one are embedded
+    together (up to ``max_batch`` texts) by a lazily started worker thread.
+    """
+
+    def __init__(self, max_batch: int, max_wait: float) -> None:
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        future: Future = Future()
+        self._queue.put((texts, future))
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="doc-embed-batcher", daemon=True
+                )
+                self._worker.start()
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0][0])
+            deadline = time.monotonic() + self._max_wait
+            while size < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            try:
+                vectors = embed_texts([text for texts, _ in batch for text in texts])
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            offset = 0
+            for texts, future in batch:
+                future.set_result(vectors[offset : offset + len(texts)])
+                offset += len(texts)
+
+
+_query_batcher = _BatchingEmbedder(QUERY_BATCH_MAX_TEXTS, QUERY_BATCH_WAIT_SECONDS)
+
+
+def embed_queries(queries: Sequence[str]) -> List[List[float]]:
+    """Embed search queries in one batch, reusing recently cached vectors."""
+
+    now = time.monotonic()
+    vectors: List[Optional[List[float]]] = []
+    with _query_cache_lock:
+        for query in queries:
+            entry = _query_cache.get(query)
+            if entry is not None and now - entry[0] < QUERY_CACHE_TTL_SECONDS:
+                _query_cache.move_to_end(query)
+                vectors.append(entry[1])
+            else:
+                vectors.append(None)
+
+    missing = list(dict.fromkeys(q for q, v in zip(queries, vectors) if v is None))
+    if missing:
+        fresh = dict(zip(missing, _query_batcher.embed(missing)))
+        with _query_cache_lock:
+            for query, vector in fresh.items():
+                _query_cache[query] = (now, vector)
+                _query_cache.move_to_end(query)
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+        vectors = [v if v is not None else fresh[q] for q, v in zip(queries, vectors)]
 
-    model = _load_model()
-    embeddings = list(model.embed(list(texts)))
-    return [vector.tolist() for vector in embeddings]
+    return vectors  # type: ignore[return-value]
 
 
 def embed_query(text: str) -> List[float]:
     """Shortcut for single-question embeddings."""
 
-    return embed_texts([text])[0]
+    return embed_queries([text])[0]
@@ -0,0 +1,316 @@
+"""Optional on-disk exact vector index for the doc chatbot.
+
+When ``DOC_LOCAL_INDEX_DIR`` is set, ingestion mirrors every chunk vector into
+a per-namespace float16 matrix (one row per chunk, memory-mapped on read) with
+a JSON sidecar holding the row keys and metadata. Retrieval then scores the
+rows with blocked float32 matrix products instead of a control-plane round
+trip.
+Large namespaces additionally get an HNSW graph (when ``hnswlib`` is
+installed) so a search visits a small fraction of the rows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+from config import CONFIG
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - the HNSW graph is optional
+    hnswlib = None
+
+# Namespaces with at least this many chunks get an HNSW graph next to the
+# matrix; smaller ones are cheaper to scan exactly.
+ANN_MIN_ROWS = 20_000
+ANN_M = 16
+ANN_EF_CONSTRUCTION = 200
+ANN_EF_SEARCH = 64
+
+# Rows are stored as float16 (half the bytes to page in and scan) and upcast
+# to float32 this many at a time, so each BLAS product works on a block that
+# stays in cache.
+ROW_DTYPE = np.float16
+SEARCH_BLOCK_ROWS = 8192
+
+
+def index_dir() -> Optional[Path]:
+    """Directory holding local indexes, or None when the feature is off."""
+
+    return CONFIG.local_index_dir
+
+
+def _paths(root: Path, namespace: str) -> Tuple[Path, Path, Path]:
+    stem = quote(namespace, safe="")
+    return (
+        root / f"{stem}.emb.f16",
+        root / f"{stem}.meta.json",
+        root / f"{stem}.hnsw",
+    )
+
+
+def _read_meta(path: Path) -> Optional[Dict[str, Any]]:
+    """Committed sidecar, or None if absent or written for another row format."""
+
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    return meta if meta.get("dtype") == np.dtype(ROW_DTYPE).name else None
+
+
+class LocalIndexWriter:
+    """Upserts chunk vectors into a namespace's on-disk matrix.
+
+    Rows are written as they arrive; the sidecar is only replaced on
+    :meth:`commit`. Appended rows stay invisible to readers until then, but
+    rows updated in place go through the shared file, so readers that already
+    map it see the new vectors immediately (with the old metadata until the
+    commit).
+    """
+
+    def __init__(self, root: Path, namespace: str) -> None:
+        root.mkdir(parents=True, exist_ok=True)
+        self._matrix_path, self._meta_path, self._ann_path = _paths(root, namespace)
+        self._dim: Optional[int] = None
+        self._keys: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        meta = _read_meta(self._meta_path)
+        if meta is not None:
+            self._dim = meta["dim"]
+            self._keys = meta["keys"]
+            self._metadata = meta["metadata"]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._changed_rows: Set[int] = set()
+
+        # Drop rows appended by a run that never committed.
+        with open(self._matrix_path, "ab") as handle:
+            handle.truncate(
+                len(self._keys) * (self._dim or 0) * np.dtype(ROW_DTYPE).itemsize
+            )
+
+    def add(
+        self,
+        keys: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        metadata: Sequence[Dict[str, Any]],
+    ) -> None:
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if not len(vectors):
+            return
+        if self._dim is None:
+            self._dim = int(vectors.shape[1])
+        elif vectors.shape[1] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match index dimension {self._dim}"
+            )
+
+        existing = len(self._keys)
+        appended: List[int] = []
+        updates: List[Tuple[int, int]] = []
+        for position, (key, meta) in enumerate(zip(keys, metadata)):
+            row = self._rows.get(key)
+            if row is None:
+                self._rows[key] = len(self._keys)
+                self._keys.append(key)
+                self._metadata.append(meta)
+                appended.append(position)
+            else:
+                self._metadata[row] = meta
+                updates.append((row, position))
+        self._changed_rows.update(range(existing, len(self._keys)))
+        self._changed_rows.update(row for row, _ in updates)
+
+        if updates:
+            matrix = np.memmap(
+                self._matrix_path,
+                dtype=ROW_DTYPE,
+                mode="r+",
+                shape=(existing, self._dim),
+            )
+            for row, position in updates:
+                matrix[row] = vectors[position]
+            matrix.flush()
+            del matrix
+        if appended:
+            with open(self._matrix_path, "ab") as handle:
+                vectors[appended].astype(ROW_DTYPE).tofile(handle)
+
+    def commit(self) -> None:
+        # The graph is replaced before the sidecar, so readers that see the
+        # new rows also see a graph covering them.
+        if hnswlib is not None and len(self._keys) >= ANN_MIN_ROWS:
+            self._update_ann()
+        else:
+            self._ann_path.unlink(missing_ok=True)
+
+        tmp_path = self._meta_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "dtype": np.dtype(ROW_DTYPE).name,
+                    "dim": self._dim,
+                    "keys": self._keys,
+                    "metadata": self._metadata,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self._meta_path)
+
+    def _update_ann(self) -> None:
+        """Add changed rows to the HNSW graph, building it on first use."""
+
+        rows = len(self._keys)
+        matrix = np.memmap(
+            self._matrix_path, dtype=ROW_DTYPE, mode="r", shape=(rows, self._dim)
+        )
+        graph = hnswlib.Index(space="cosine", dim=self._dim)
+        if self._ann_path.exists():
+            graph.load_index(str(self._ann_path), max_elements=rows)
+            labels = np.fromiter(sorted(self._changed_rows), dtype=np.int64)
+            vectors = matrix[labels]
+        else:
+            graph.init_index(
+                max_elements=rows, ef_construction=ANN_EF_CONSTRUCTION, M=ANN_M
+            )
+            labels = np.arange(rows)
+            vectors = matrix
+        if len(labels):
+            graph.add_items(np.asarray(vectors, dtype=np.float32), labels)
+
+        tmp_path = self._ann_path.with_suffix(".hnsw.tmp")
+        graph.save_index(str(tmp_path))
+        os.replace(tmp_path, self._ann_path)
+        self._changed_rows.clear()
+
+
+class LocalIndex:
+    """Read-only view over a committed namespace index."""
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        keys: List[str],
+        metadata: List[Dict[str, Any]],
+        ann: Optional[Any] = None,
+    ) -> None:
+        self._matrix = matrix
+        self._keys = keys
+        self._metadata = metadata
+        self._ann = ann
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(
+        self, query_embeddings: Sequence[Sequence[float]], top_k: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Exact cosine search; hits mirror the control plane's result shape.
+
+        Rows and queries come from ``embed_texts`` and are unit length, so the
+        dot product is the cosine similarity. With an HNSW graph loaded the
+        search is approximate, and scores are ``1 - cosine distance``.
+        """
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if not len(self._keys) or not len(queries):
+            return [[] for _ in range(len(queries))]
+
+        k = min(top_k, len(self._keys))
+        if self._ann is not None:
+            # ef must be at least k for the graph to return k neighbours.
+            self._ann.set_ef(max(ANN_EF_SEARCH, k))
+            labels, distances = self._ann.knn_query(queries, k=k)
+            top = labels.tolist()
+            top_scores = (1.0 - distances).tolist()
+        else:
+            # Keep each block's top k per query, then order the survivors:
+            # (B, N) scores never materialise at once.
+            candidate_rows: List[np.ndarray] = []
+            candidate_scores: List[np.ndarray] = []
+            for start in range(0, len(self._keys), SEARCH_BLOCK_ROWS):
+                block = self._matrix[start : start + SEARCH_BLOCK_ROWS]
+                scores = queries @ block.astype(np.float32).T
+                rows = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+                if scores.shape[1] > k:
+                    rows = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                    scores = np.take_along_axis(scores, rows, axis=1)
+                candidate_rows.append(rows + start)
+                candidate_scores.append(scores)
+            rows = np.concatenate(candidate_rows, axis=1)
+            scores = np.concatenate(candidate_scores, axis=1)
+            order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+            top = np.take_along_axis(rows, order, axis=1).tolist()
+            top_scores = np.take_along_axis(scores, order, axis=1).tolist()
+        return [
+            [
+                {
+                    "key": self._keys[row],
+                    "score": score,
+                    "metadata": self._metadata[row],
+                }
+                for row, score in zip(rows, row_scores)
+            ]
+            for rows, row_scores in zip(top, top_scores)
+        ]
+
+
+_cache: Dict[str, Tuple[int, LocalIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_index(namespace: str) -> Optional[LocalIndex]:
+    """Return the committed index for ``namespace``, reloading it after commits."""
+
+    root = index_dir()
+    if root is None:
+        return None
+    matrix_path, meta_path, ann_path = _paths(root, namespace)
+    try:
+        version = meta_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _cache_lock:
+        cached = _cache.get(namespace)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        meta = _read_meta(meta_path)
+        if meta is None:
+            return None
+        rows, dim = len(meta["keys"]), meta["dim"] or 0
+        matrix = (
+            np.memmap(matrix_path, dtype=ROW_DTYPE, mode="r", shape=(rows, dim))
+            if rows
+            else np.zeros((0, dim), dtype=ROW_DTYPE)
+        )
+        ann = None
+        if hnswlib is not None and rows and ann_path.exists():
+            ann = hnswlib.Index(space="cosine", dim=dim)
+            ann.load_index(str(ann_path))
+            if ann.get_current_count() != rows:
+                ann = None
+        index = LocalIndex(matrix, meta["keys"], meta["metadata"], ann)
+        _cache[namespace] = (version, index)
+        return index
+
+
+def drop_index(namespace: str) -> None:
+    """Delete the local index for ``namespace`` if one exists."""
+
+    root = index_dir()
+    if root is None:
+        return
+    with _cache_lock:
+        _cache.pop(namespace, None)
+        for path in _paths(root, namespace):
+            path.unlink(missing_ok=True)
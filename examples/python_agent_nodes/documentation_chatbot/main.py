@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 import sys
+import threading
 
 from agentfield import AIConfig, Agent
 from agentfield.logger import log_info
@@ -14,7 +15,7 @@ if __package__ in (None, ""):
     if str(current_dir) not in sys.path:
         sys.path.insert(0, str(current_dir))
 
-from embedding import embed_texts
+import embedding
 from routers import (
     ingestion_router,
     qa_router,
@@ -43,14 +44,18 @@ for router in (
 def _warmup_embeddings() -> None:
     """Warm up the embedding model on startup."""
     try:
-        embed_texts(["doc-chatbot warmup"])
+        embedding.warm_up()
         log_info("FastEmbed model warmed up for documentation chatbot")
     except Exception as exc:  # pragma: no cover - best-effort
         log_info(f"FastEmbed warmup failed: {exc}")
 
 
 if __name__ == "__main__":
-    _warmup_embeddings()
+    # Load the model while the server binds; early requests wait on the model
+    # lock in embedding._load_model rather than loading it twice.
+    threading.Thread(
+        target=_warmup_embeddings, name="doc-embed-warmup", daemon=True
+    ).start()
 
     print("📚 Simplified Documentation Chatbot Agent")
     print("🧠 Node ID: documentation-chatbot")
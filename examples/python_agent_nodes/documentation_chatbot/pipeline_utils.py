@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence
-
+import asyncio
+import io
+import re
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
 from agentfield.logger import log_info
 
 from schemas import Citation, DocumentContext, RetrievalResult
 
 
+@lru_cache(maxsize=1024)
 def alpha_key(index: int) -> str:
     """Convert index to alphabetic key (0->A, 1->B, ..., 26->AA)."""
     if index < 0:
@@ -33,28 +40,34 @@ def filter_hits(
     min_score: float,
 ) -> List[Dict]:
     """Filter vector search hits by namespace and minimum score."""
-    filtered: List[Dict] = []
-    for hit in hits:
-        metadata = hit.get("metadata", {})
-        if metadata.get("namespace") != namespace:
-            continue
-        if hit.get("score", 0.0) < min_score:
-            continue
-        filtered.append(hit)
-    return filtered
+    if not hits:
+        return []
+
+    scores = np.fromiter(
+        (hit.get("score", 0.0) for hit in hits), dtype=np.float64, count=len(hits)
+    )
+    in_namespace = np.fromiter(
+        (hit.get("metadata", {}).get("namespace") == namespace for hit in hits),
+        dtype=bool,
+        count=len(hits),
+    )
+    return [hits[i] for i in np.flatnonzero((scores >= min_score) & in_namespace)]
+
+
+_score = attrgetter("score")
 
 
 def deduplicate_results(results: List[RetrievalResult]) -> List[RetrievalResult]:
-    """Deduplicate by source, keeping highest score per unique chunk."""
-    by_source: Dict[str, RetrievalResult] = {}
+    """Deduplicate by source, keeping highest score per unique chunk.
 
-    for result in results:
-        if result.source in by_source:
-            if by_source[result.source].score >= result.score:
-                continue
-        by_source[result.source] = result
+    Sorting first means the first result seen for a source is its best, and
+    the survivors come out already in score order.
+    """
+    by_source: Dict[str, RetrievalResult] = {}
+    for result in sorted(results, key=_score, reverse=True):
+        by_source.setdefault(result.source, result)
 
-    return sorted(by_source.values(), key=lambda r: r.score, reverse=True)
+    return list(by_source.values())
 
 
 def build_citations(results: Sequence[RetrievalResult]) -> List[Citation]:
@@ -86,43 +99,142 @@ def format_context_for_synthesis(results: Sequence[RetrievalResult]) -> str:
     if not results:
         return "(no context available)"
 
-    blocks: List[str] = []
+    buffer = io.StringIO()
     for idx, result in enumerate(results):
-        key = alpha_key(idx)
-        blocks.append(
-            f"=== CHUNK [{key}] ===\n"
-            f"Source: {result.source}\n"
-            f"Score: {result.score:.3f}\n"
-            f"Text:\n{result.text}\n"
+        if idx:
+            buffer.write("\n")
+        buffer.write("=== CHUNK [")
+        buffer.write(alpha_key(idx))
+        buffer.write("] ===\nSource: ")
+        buffer.write(result.source)
+        buffer.write(f"\nScore: {result.score:.3f}\nText:\n")
+        buffer.write(result.text)
+        buffer.write("\n")
+
+    return buffer.getvalue()
+
+
+# Only the best-scoring chunks of a document count towards its average, so a
+# long tail of weak matches cannot drag a relevant document down.
+MAX_SCORED_CHUNKS = 32
+
+# Okapi BM25 parameters and the weight of the (normalised) lexical match in
+# the document score.
+BM25_K1 = 1.5
+BM25_B = 0.75
+LEXICAL_WEIGHT = 0.3
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def lexical_scores(query: str, texts: Sequence[str]) -> np.ndarray:
+    """BM25 of ``query`` against ``texts``, scaled so the best match is 1.0."""
+    scores = np.zeros(len(texts), dtype=np.float32)
+    query_terms = set(_TOKEN_PATTERN.findall(query.lower()))
+    if not texts or not query_terms:
+        return scores
+
+    term_counts = [Counter(_TOKEN_PATTERN.findall(text.lower())) for text in texts]
+    lengths = np.fromiter(
+        (sum(counts.values()) for counts in term_counts),
+        dtype=np.float32,
+        count=len(texts),
+    )
+    length_norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(lengths.mean(), 1.0))
+
+    for term in query_terms:
+        tf = np.fromiter(
+            (counts.get(term, 0) for counts in term_counts),
+            dtype=np.float32,
+            count=len(texts),
         )
+        df = np.count_nonzero(tf)
+        if not df:
+            continue
+        idf = np.log1p((len(texts) - df + 0.5) / (df + 0.5))
+        scores += idf * tf * (BM25_K1 + 1) / (tf + length_norm)
+
+    best = scores.max()
+    return scores / best if best > 0 else scores
 
-    return "\n".join(blocks)
 
+def document_scores(
+    doc_ids: np.ndarray, scores: np.ndarray, lexical: np.ndarray, n_docs: int
+) -> np.ndarray:
+    """Score every document at once from per-chunk arrays.
 
-def calculate_document_score(chunks: Iterable[RetrievalResult]) -> float:
-    """Weighted score based on chunk scores and coverage."""
-    chunk_list = list(chunks)
-    if not chunk_list:
+    ``doc_ids[i]`` is the document (``0..n_docs-1``) of chunk ``i``. A
+    document's score is the mean of its best MAX_SCORED_CHUNKS chunk scores,
+    plus 0.05 per matching chunk (up to 5), plus the weighted best lexical
+    match; every document must have at least one chunk.
+    """
+    # Sort chunks by document, best first, and rank them within their document.
+    order = np.lexsort((-scores, doc_ids))
+    sorted_ids = doc_ids[order]
+    starts = np.searchsorted(sorted_ids, np.arange(n_docs))
+    kept = np.arange(len(order)) - starts[sorted_ids] < MAX_SCORED_CHUNKS
+
+    counts = np.bincount(doc_ids, minlength=n_docs)
+    totals = np.bincount(
+        sorted_ids[kept], weights=scores[order][kept], minlength=n_docs
+    )
+    best_lexical = np.zeros(n_docs)
+    np.maximum.at(best_lexical, doc_ids, lexical)
+
+    average_score = totals / np.minimum(counts, MAX_SCORED_CHUNKS)
+    coverage_boost = np.minimum(counts, 5) * 0.05
+    return average_score + coverage_boost + LEXICAL_WEIGHT * best_lexical
+
+
+def calculate_document_score(
+    chunks: Iterable[RetrievalResult], lexical_score: float = 0.0
+) -> float:
+    """Weighted score based on chunk scores, coverage and lexical match."""
+    scores = np.fromiter((chunk.score for chunk in chunks), dtype=np.float64)
+    if not scores.size:
         return 0.0
 
-    average_score = sum(chunk.score for chunk in chunk_list) / len(chunk_list)
-    coverage_boost = min(len(chunk_list), 5) * 0.05
-    return average_score + coverage_boost
+    doc_ids = np.zeros(scores.size, dtype=np.intp)
+    lexical = np.full(scores.size, lexical_score)
+    return float(document_scores(doc_ids, scores, lexical, 1)[0])
 
 
 async def aggregate_chunks_to_documents(
     global_memory,
     chunks: List[RetrievalResult],
     top_n: int = 5,
+    query: Optional[str] = None,
 ) -> List[DocumentContext]:
     """
     Group chunks by document, fetch full documents, and rank by relevance.
+
+    When ``query`` is given, each document is boosted by the best BM25 match of
+    its chunks against it.
     """
-    by_document: Dict[str, List[RetrievalResult]] = defaultdict(list)
-    for chunk in chunks:
+    lexical = (
+        lexical_scores(query, [chunk.text for chunk in chunks])
+        if query
+        else np.zeros(len(chunks), dtype=np.float32)
+    )
+
+    # One pass numbers documents in first-seen order, records each chunk's
+    # document index for document_scores and collects matched sections (dict
+    # keys double as an insertion-ordered set).
+    by_document: Dict[str, int] = {}
+    sections: List[Dict[str, None]] = []
+    doc_ids: List[int] = []
+    positions: List[int] = []
+    for position, chunk in enumerate(chunks):
         doc_key = chunk.metadata.get("document_key")
-        if doc_key:
-            by_document[doc_key].append(chunk)
+        if not doc_key:
+            continue
+        doc_id = by_document.setdefault(doc_key, len(by_document))
+        if doc_id == len(sections):
+            sections.append({})
+        section = chunk.metadata.get("section")
+        if section:
+            sections[doc_id][section] = None
+        doc_ids.append(doc_id)
+        positions.append(position)
 
     if not by_document:
         log_info("[aggregate_chunks_to_documents] No document keys found in chunks")
@@ -132,35 +244,34 @@ async def aggregate_chunks_to_documents(
         f"[aggregate_chunks_to_documents] Found {len(by_document)} unique documents"
     )
 
+    doc_bodies = await asyncio.gather(
+        *(global_memory.get(key=doc_key) for doc_key in by_document)
+    )
+
+    ids = np.asarray(doc_ids, dtype=np.intp)
+    picked = np.asarray(positions, dtype=np.intp)
+    chunk_scores = np.fromiter(
+        (chunks[position].score for position in positions),
+        dtype=np.float64,
+        count=len(positions),
+    )
+    relevance = document_scores(ids, chunk_scores, lexical[picked], len(by_document))
+    matching = np.bincount(ids, minlength=len(by_document))
+
     document_contexts: List[DocumentContext] = []
-    for doc_key, doc_chunks in by_document.items():
-        doc_data = await global_memory.get(key=doc_key)
+    for doc_id, (doc_key, doc_data) in enumerate(zip(by_document, doc_bodies)):
         if not doc_data:
             log_info(f"[aggregate_chunks_to_documents] Document not found: {doc_key}")
             continue
 
-        relevance_score = calculate_document_score(doc_chunks)
-
-        matched_sections = [
-            chunk.metadata.get("section")
-            for chunk in doc_chunks
-            if chunk.metadata.get("section")
-        ]
-        seen = set()
-        unique_sections = []
-        for section in matched_sections:
-            if section not in seen:
-                seen.add(section)
-                unique_sections.append(section)
-
         document_contexts.append(
             DocumentContext(
                 document_key=doc_key,
                 full_text=doc_data.get("full_text", ""),
                 relative_path=doc_data.get("relative_path", "unknown"),
-                matching_chunks=len(doc_chunks),
-                relevance_score=relevance_score,
-                matched_sections=unique_sections,
+                matching_chunks=int(matching[doc_id]),
+                relevance_score=float(relevance[doc_id]),
+                matched_sections=list(sections[doc_id]),
             )
         )
 
@@ -181,13 +292,19 @@ def format_documents_for_synthesis(documents: Sequence[DocumentContext]) -> str:
     if not documents:
         return "(no documents available)"
 
-    blocks: List[str] = []
+    buffer = io.StringIO()
     for idx, doc in enumerate(documents):
-        key = alpha_key(idx)
-        header = f"=== DOCUMENT [{key}]: {doc.relative_path} ==="
-        blocks.append(f"{header}\n\n{doc.full_text}\n")
-
-    return "\n".join(blocks)
+        if idx:
+            buffer.write("\n")
+        buffer.write("=== DOCUMENT [")
+        buffer.write(alpha_key(idx))
+        buffer.write("]: ")
+        buffer.write(doc.relative_path)
+        buffer.write(" ===\n\n")
+        buffer.write(doc.full_text)
+        buffer.write("\n")
+
+    return buffer.getvalue()
 
 
 def build_citations_from_documents(
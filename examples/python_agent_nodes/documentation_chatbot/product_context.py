@@ -1,5 +1,10 @@
 """Shared product context used across documentation chatbot modules."""
 
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Tuple
+
 PRODUCT_CONTEXT = """
 ## Product Overview
 AgentField is a Kubernetes-style control plane with IAM for building next generation of autonomous software. It provides production infrastructure
@@ -128,7 +133,11 @@ The documentation is organized by:
 - **Guides**: Deployment, testing, multi-agent patterns, examples
 - **API Reference**: Python SDK, Go SDK, TypeScript SDK, CLI commands, REST APIs
 - **Examples**: Customer support, research assistant, terminal assistant
+"""
 
+# Kept out of PRODUCT_CONTEXT: prompts carry only the rows a question triggers
+# (see expand_query_terms) instead of the whole table.
+_SEARCH_TERM_RELATIONSHIPS = """
 ## Search Term Relationships
 
 When users ask about:
@@ -144,3 +153,34 @@ When users ask about:
 - "Architecture" → Look for: distributed architecture, control plane, agent nodes, microservices, stateless design
 - "SDK" or "language" or "languages" or "supported" → Look for: Python SDK, Go SDK, TypeScript SDK, npm install @agentfield/sdk, pip install agentfield
 """
+
+_RELATIONSHIP_PATTERN = re.compile(r"^- (.+?) → Look for: (.+)$", re.MULTILINE)
+
+# ("identity", "authentication", "security") -> ("DIDs", "Verifiable Credentials", ...)
+SEARCH_TERM_MAP: Dict[Tuple[str, ...], Tuple[str, ...]] = {
+    tuple(trigger.lower() for trigger in re.findall(r'"([^"]+)"', triggers)): tuple(
+        term.strip() for term in terms.split(",")
+    )
+    for triggers, terms in _RELATIONSHIP_PATTERN.findall(_SEARCH_TERM_RELATIONSHIPS)
+}
+
+_TRIGGER_PATTERNS = [
+    (
+        re.compile(
+            r"\b(?:" + "|".join(re.escape(trigger) for trigger in triggers) + r")\b"
+        ),
+        terms,
+    )
+    for triggers, terms in SEARCH_TERM_MAP.items()
+]
+
+
+def expand_query_terms(query: str) -> List[str]:
+    """Related product terms for every relationship row ``query`` mentions."""
+
+    lowered = query.lower()
+    expanded: Dict[str, None] = {}
+    for pattern, terms in _TRIGGER_PATTERNS:
+        if pattern.search(lowered):
+            expanded.update(dict.fromkeys(terms))
+    return list(expanded)
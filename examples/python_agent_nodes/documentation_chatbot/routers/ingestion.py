@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import multiprocessing
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from agentfield import AgentRouter
 from agentfield.logger import log_info
 
 from chunking import chunk_markdown_text, is_supported_file, read_text
+from config import CONFIG
 from embedding import embed_texts
-from schemas import IngestReport
+from local_index import LocalIndexWriter, drop_index, index_dir
+from schemas import DocumentChunk, IngestReport
 
 try:
     import httpx
@@ -19,18 +28,29 @@ except ImportError:  # pragma: no cover - httpx is installed in runtime environm
 
 ingestion_router = AgentRouter(tags=["ingestion"])
 
+# Chunks are embedded across file boundaries in batches of this size, and
+# at most MAX_CONCURRENT_WRITES memory writes are in flight at once.
+EMBED_BATCH_SIZE = 256
+MAX_CONCURRENT_WRITES = 8
+# Files are read on worker threads and chunked in worker processes,
+# MAX_CONCURRENT_READS files at a time, and up to READ_QUEUE_SIZE chunked files
+# may wait for embedding.
+MAX_CONCURRENT_READS = 16
+READ_QUEUE_SIZE = 64
+
+PendingChunk = Tuple[str, str, Dict[str, Any]]  # (vector_key, text, metadata)
+
 
 async def _clear_namespace_via_api(namespace: str) -> dict:
     """Call control plane delete-namespace endpoint."""
     if httpx is None:
         raise RuntimeError("httpx is required for clear_namespace")
 
-    base_url = os.getenv("CONTROL_PLANE_URL") or os.getenv("AGENTFIELD_SERVER") or ""
-    base_url = base_url.rstrip("/")
+    base_url = CONFIG.control_plane_url
     if not base_url:
         raise ValueError("CONTROL_PLANE_URL (or AGENTFIELD_SERVER) is required to clear namespace")
 
-    api_key = os.getenv("CONTROL_PLANE_API_KEY") or os.getenv("AGENTFIELD_API_KEY")
+    api_key = CONFIG.control_plane_api_key
     headers = {"Content-Type": "application/json"}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
@@ -46,11 +66,126 @@ async def _clear_namespace_via_api(namespace: str) -> dict:
 async def clear_namespace(namespace: str = "website-docs") -> dict:
     """Wipe all vectors for a namespace before re-indexing."""
     result = await _clear_namespace_via_api(namespace)
+    await asyncio.to_thread(drop_index, namespace)
     deleted = result.get("deleted", 0)
     log_info(f"Cleared namespace '{namespace}' (deleted {deleted} vectors)")
     return {"namespace": namespace, "deleted": deleted}
 
 
+# (path, full_text, chunks, read_error)
+LoadedFile = Tuple[Path, Optional[str], List[DocumentChunk], Optional[Exception]]
+
+
+@lru_cache(maxsize=1)
+def _chunk_executor() -> ProcessPoolExecutor:
+    """Process pool for chunking, created on first ingestion.
+
+    Workers come from a fork server rather than forking this process, which by
+    then runs the embedder thread, ONNX Runtime threads and the event loop; a
+    plain fork could inherit a lock one of them holds.
+    """
+
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+    atexit.register(executor.shutdown, cancel_futures=True)
+    return executor
+
+
+async def _load_files(
+    paths: Sequence[Path],
+    root: Path,
+    namespace: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    queue: "asyncio.Queue[Optional[LoadedFile]]",
+) -> None:
+    """Read and chunk ``paths`` off the event loop, enqueueing in input order.
+
+    ``None`` is enqueued when done (or on failure, after which awaiting this
+    task re-raises the error).
+    """
+
+    loop = asyncio.get_running_loop()
+    executor = _chunk_executor()
+
+    async def _load(path: Path) -> LoadedFile:
+        try:
+            full_text = await asyncio.to_thread(read_text, path)
+        except Exception as exc:  # pragma: no cover - defensive
+            return path, None, [], exc
+        chunks = await loop.run_in_executor(
+            executor,
+            partial(
+                chunk_markdown_text,
+                full_text,
+                relative_path=path.relative_to(root).as_posix(),
+                namespace=namespace,
+                chunk_size=chunk_size,
+                overlap=chunk_overlap,
+            ),
+        )
+        return path, full_text, chunks, None
+
+    in_flight: deque = deque()
+    try:
+        for path in paths:
+            in_flight.append(asyncio.ensure_future(_load(path)))
+            if len(in_flight) >= MAX_CONCURRENT_READS:
+                await queue.put(await in_flight.popleft())
+        while in_flight:
+            await queue.put(await in_flight.popleft())
+    except Exception:
+        await queue.put(None)
+        raise
+    finally:
+        for task in in_flight:
+            task.cancel()
+    await queue.put(None)
+
+
+async def _flush_batch(
+    global_memory,
+    documents: List[Tuple[str, Dict[str, Any]]],
+    pending: List[PendingChunk],
+    semaphore: asyncio.Semaphore,
+    local_index: Optional[LocalIndexWriter] = None,
+) -> int:
+    """Embed ``pending`` in one call and write documents + vectors concurrently."""
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    embeddings = (
+        await asyncio.to_thread(embed_texts, [text for _, text, _ in pending])
+        if pending
+        else []
+    )
+    writes = [
+        _bounded(global_memory.set(key=document_key, data=data))
+        for document_key, data in documents
+    ]
+    writes.extend(
+        _bounded(
+            global_memory.set_vector(key=vector_key, embedding=embedding, metadata=metadata)
+        )
+        for (vector_key, _, metadata), embedding in zip(pending, embeddings)
+    )
+    if local_index is not None and pending:
+        writes.append(
+            asyncio.to_thread(
+                local_index.add,
+                [vector_key for vector_key, _, _ in pending],
+                embeddings,
+                [metadata for _, _, metadata in pending],
+            )
+        )
+    await asyncio.gather(*writes)
+    return len(pending)
+
+
 @ingestion_router.reasoner()
 async def ingest_folder(
     folder_path: str,
@@ -82,57 +217,77 @@ async def ingest_folder(
 
     global_memory = ingestion_router.memory.global_scope
 
+    index_root = index_dir()
+    local_index = (
+        await asyncio.to_thread(LocalIndexWriter, index_root, namespace)
+        if index_root is not None
+        else None
+    )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+    documents: List[Tuple[str, Dict[str, Any]]] = []
+    pending: List[PendingChunk] = []
+
+    # Reading and chunking run ahead of embedding through a bounded queue so
+    # disk and CPU work overlap with embedding and vector writes.
+    queue: "asyncio.Queue[Optional[LoadedFile]]" = asyncio.Queue(maxsize=READ_QUEUE_SIZE)
+    loader = asyncio.create_task(
+        _load_files(supported_files, root, namespace, chunk_size, chunk_overlap, queue)
+    )
+
     total_chunks = 0
-    for file_path in supported_files:
-        relative_path = file_path.relative_to(root).as_posix()
-        try:
-            full_text = read_text(file_path)
-        except Exception as exc:  # pragma: no cover - defensive
-            skipped.append(f"{relative_path} (error: {exc})")
-            continue
-
-        # TIER 1: Store full document ONCE
-        document_key = f"{namespace}:doc:{relative_path}"
-        await global_memory.set(
-            key=document_key,
-            data={
-                "full_text": full_text,
-                "relative_path": relative_path,
-                "namespace": namespace,
-                "file_size": len(full_text),
-            },
-        )
+    try:
+        while (item := await queue.get()) is not None:
+            file_path, full_text, doc_chunks, error = item
+            relative_path = file_path.relative_to(root).as_posix()
+            if error is not None:
+                skipped.append(f"{relative_path} (error: {error})")
+                continue
 
-        # Create chunks
-        doc_chunks = chunk_markdown_text(
-            full_text,
-            relative_path=relative_path,
-            namespace=namespace,
-            chunk_size=chunk_size,
-            overlap=chunk_overlap,
-        )
-        if not doc_chunks:
-            continue
-
-        # TIER 2: Store chunk vectors with document reference
-        embeddings = embed_texts([chunk.text for chunk in doc_chunks])
-        for idx, (chunk, embedding) in enumerate(zip(doc_chunks, embeddings)):
-            vector_key = f"{namespace}|{chunk.chunk_id}"
-            metadata = {
-                "text": chunk.text,
-                "namespace": namespace,
-                "relative_path": chunk.relative_path,
-                "section": chunk.section,
-                "start_line": chunk.start_line,
-                "end_line": chunk.end_line,
-                "document_key": document_key,
-                "chunk_index": idx,
-                "total_chunks": len(doc_chunks),
-            }
-            await global_memory.set_vector(
-                key=vector_key, embedding=embedding, metadata=metadata
+            # TIER 1: Store full document ONCE
+            document_key = f"{namespace}:doc:{relative_path}"
+            documents.append(
+                (
+                    document_key,
+                    {
+                        "full_text": full_text,
+                        "relative_path": relative_path,
+                        "namespace": namespace,
+                        "file_size": len(full_text),
+                    },
+                )
             )
-            total_chunks += 1
+
+            # TIER 2: Queue chunk vectors with document reference
+            for idx, chunk in enumerate(doc_chunks):
+                metadata = {
+                    "text": chunk.text,
+                    "namespace": namespace,
+                    "relative_path": chunk.relative_path,
+                    "section": chunk.section,
+                    "start_line": chunk.start_line,
+                    "end_line": chunk.end_line,
+                    "document_key": document_key,
+                    "chunk_index": idx,
+                    "total_chunks": len(doc_chunks),
+                }
+                pending.append((f"{namespace}|{chunk.chunk_id}", chunk.text, metadata))
+
+            if len(pending) >= EMBED_BATCH_SIZE:
+                total_chunks += await _flush_batch(
+                    global_memory, documents, pending, semaphore, local_index
+                )
+                documents, pending = [], []
+        await loader
+    finally:
+        loader.cancel()
+
+    if documents or pending:
+        total_chunks += await _flush_batch(
+            global_memory, documents, pending, semaphore, local_index
+        )
+    if local_index is not None:
+        await asyncio.to_thread(local_index.commit)
 
     log_info(
         f"Ingested {total_chunks} chunks from {len(supported_files)} files into namespace '{namespace}'"
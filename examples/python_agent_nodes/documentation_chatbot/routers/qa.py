@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from agentfield import AgentRouter
 from agentfield.logger import log_info
 
+from config import CONFIG
+from embedding import embed_queries, embed_query
 from pipeline_utils import (
     aggregate_chunks_to_documents,
     build_citations,
@@ -15,41 +20,345 @@ from pipeline_utils import (
     format_context_for_synthesis,
     format_documents_for_synthesis,
 )
-from product_context import PRODUCT_CONTEXT
+from product_context import PRODUCT_CONTEXT, expand_query_terms
 from routers.query_planning import plan_queries
 from routers.retrieval import parallel_retrieve
-from schemas import DocAnswer, RetrievalResult
+from schemas import Citation, DocAnswer, QueryPlan, RetrievalResult
 
 qa_router = AgentRouter(tags=["qa"])
 
+# With SEMANTIC_CACHE=1, confident answers are reused for paraphrased
+# questions: same reasoner and retrieval parameters, question cosine >= the
+# threshold, and an answer younger than the TTL.
+SEMANTIC_CACHE_SIZE = 1000
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_TTL_SECONDS = 600.0
 
-@qa_router.reasoner()
-async def synthesize_answer(
+# The question itself is searched while the planner runs, and likely
+# refinement context is prefetched during synthesis; later queries at least
+# this similar to one already searched would only repeat that search.
+DUPLICATE_QUERY_SIMILARITY = 0.95
+
+# Aspects answers most often come back missing; prefetched as
+# "{question} {facet}" alongside the planned queries.
+SPECULATIVE_FACETS = ("details", "examples", "configuration")
+
+# (reasoner, namespace, top_k, min_score, top_documents); qa_answer uses 0 documents.
+CacheParams = Tuple[str, str, int, float, int]
+
+
+class SemanticCache:
+    """Recent answers indexed by their question's embedding.
+
+    Question embeddings are unit length, so one matrix-vector product scores
+    every cached question. When full, the least recently used (or any expired)
+    entry is replaced.
+    """
+
+    def __init__(self, max_entries: int, threshold: float, ttl: float) -> None:
+        self._threshold = threshold
+        self._ttl = ttl
+        self._vectors: Optional[np.ndarray] = None
+        self._params: List[Optional[CacheParams]] = [None] * max_entries
+        self._answers: List[Optional[DocAnswer]] = [None] * max_entries
+        self._created = np.full(max_entries, -np.inf)
+        self._last_used = np.full(max_entries, -np.inf)
+
+    def get(self, params: CacheParams, embedding: List[float]) -> Optional[DocAnswer]:
+        if self._vectors is None:
+            return None
+        now = time.monotonic()
+        valid = (now - self._created < self._ttl) & np.fromiter(
+            (cached == params for cached in self._params),
+            dtype=bool,
+            count=len(self._params),
+        )
+        if not valid.any():
+            return None
+        query = np.asarray(embedding, dtype=np.float32)
+        scores = np.where(valid, self._vectors @ query, -np.inf)
+        best = int(np.argmax(scores))
+        if scores[best] < self._threshold:
+            return None
+        self._last_used[best] = now
+        return self._answers[best].model_copy(deep=True)
+
+    def put(
+        self, params: CacheParams, embedding: List[float], answer: DocAnswer
+    ) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if self._vectors is None:
+            self._vectors = np.zeros((len(self._params), len(vector)), dtype=np.float32)
+        now = time.monotonic()
+        slot = int(
+            np.argmin(
+                np.where(now - self._created < self._ttl, self._last_used, -np.inf)
+            )
+        )
+        self._vectors[slot] = vector
+        self._params[slot] = params
+        self._answers[slot] = answer.model_copy(deep=True)
+        self._created[slot] = self._last_used[slot] = now
+
+
+_semantic_cache = (
+    SemanticCache(
+        SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_TTL_SECONDS
+    )
+    if CONFIG.semantic_cache
+    else None
+)
+
+
+async def _semantic_cached(
+    params: CacheParams,
     question: str,
-    results: List[RetrievalResult],
-    is_refinement: bool = False,
+    answer: Callable[[Optional[List[float]]], Awaitable[DocAnswer]],
 ) -> DocAnswer:
-    """Generate answer with self-assessment of completeness."""
+    """Serve ``question`` from the semantic cache, else ``answer`` it and cache the result.
 
-    if not results:
-        return DocAnswer(
-            answer="I could not find any relevant documentation to answer this question.",
-            citations=[],
-            confidence="insufficient",
-            needs_more=False,
-            missing_topics=["No documentation found for this topic"],
+    ``answer`` receives the question's embedding (None when caching is off)
+    so the pipeline does not embed the question a second time. Only
+    confident, cited answers are cached.
+    """
+
+    if _semantic_cache is None:
+        return await answer(None)
+
+    embedding = await asyncio.to_thread(embed_query, question)
+    cached = _semantic_cache.get(params, embedding)
+    if cached is not None:
+        log_info(f"[{params[0]}] Semantic cache hit for: {question}")
+        return cached
+
+    result = await answer(embedding)
+    if result.citations and result.confidence == "high":
+        _semantic_cache.put(params, embedding, result)
+    return result
+
+
+def _retrieval_queries(question: str, plan: QueryPlan) -> List[str]:
+    """Plan queries plus one expanded with the product terms the question triggers."""
+
+    terms = expand_query_terms(question)
+    if not terms:
+        return plan.queries
+    expanded = f"{question} {' '.join(terms)}"
+    return plan.queries if expanded in plan.queries else [*plan.queries, expanded]
+
+
+def _drop_near_duplicates(
+    queries: List[str],
+    embeddings: List[List[float]],
+    searched: List[List[float]],
+) -> Tuple[List[str], List[List[float]]]:
+    """Keep the queries (and embeddings) not near-duplicating a ``searched`` embedding."""
+
+    if not searched:
+        return queries, embeddings
+    similarity = (
+        np.asarray(embeddings, dtype=np.float32)
+        @ np.asarray(searched, dtype=np.float32).T
+    )
+    kept = [
+        i
+        for i, score in enumerate(similarity.max(axis=1))
+        if score < DUPLICATE_QUERY_SIMILARITY
+    ]
+    return [queries[i] for i in kept], [embeddings[i] for i in kept]
+
+
+async def _planned_queries(
+    question: str, plan: QueryPlan, question_embedding: List[float]
+) -> Tuple[List[str], List[List[float]]]:
+    """Retrieval queries (and their embeddings) the question's own search does not cover."""
+
+    queries = _retrieval_queries(question, plan)
+    if not queries:
+        return [], []
+    embeddings = await asyncio.to_thread(embed_queries, queries)
+    return _drop_near_duplicates(queries, embeddings, [question_embedding])
+
+
+RetrievalKey = Tuple[str, str, int, float]  # (question, namespace, top_k, min_score)
+
+# Plan + first-pass retrieval currently in flight, so concurrent requests for
+# the same question (both QA modes, client retries) share one run.
+_inflight_retrievals: Dict[
+    RetrievalKey, "asyncio.Future[Tuple[QueryPlan, List[RetrievalResult]]]"
+] = {}
+
+
+async def _shared_retrieve_while_planning(
+    question: str,
+    question_embedding: Optional[List[float]],
+    namespace: str,
+    top_k: int,
+    min_score: float,
+) -> Tuple[QueryPlan, List[RetrievalResult]]:
+    """``_retrieve_while_planning``, joined with an identical run already in flight.
+
+    Each caller awaits the shared task through ``asyncio.shield`` so one
+    caller being cancelled does not cancel the others' work.
+    """
+
+    key = (question, namespace, top_k, min_score)
+    task = _inflight_retrievals.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _retrieve_while_planning(
+                question, question_embedding, namespace, top_k, min_score
+            )
         )
+        _inflight_retrievals[key] = task
+        task.add_done_callback(lambda _: _inflight_retrievals.pop(key, None))
+    else:
+        log_info(f"[qa] Joining in-flight planning and retrieval for: {question}")
+    plan, results = await asyncio.shield(task)
+    return plan, list(results)
 
-    context_text = format_context_for_synthesis(results)
-    citations = build_citations(results)
 
-    # Build citation key reference for the prompt
-    citation_keys = [c.key for c in citations]
-    key_map = "\n".join(
-        [f"  {c.key}: {c.relative_path}:{c.start_line}-{c.end_line}" for c in citations]
+async def _retrieve_while_planning(
+    question: str,
+    question_embedding: Optional[List[float]],
+    namespace: str,
+    top_k: int,
+    min_score: float,
+) -> Tuple[QueryPlan, List[RetrievalResult]]:
+    """Plan queries and search the raw question concurrently, then search the plan.
+
+    The question is embedded once (unless the caller already has its
+    embedding) and that vector serves both its own search and the
+    near-duplicate check on the planned queries.
+    """
+
+    plan_task = asyncio.ensure_future(plan_queries(question))
+    try:
+        if question_embedding is None:
+            question_embedding = await asyncio.to_thread(embed_query, question)
+        question_results = await parallel_retrieve(
+            queries=[question],
+            namespace=namespace,
+            top_k=top_k,
+            min_score=min_score,
+            query_embeddings=[question_embedding],
+        )
+        plan = await plan_task
+    except BaseException:
+        plan_task.cancel()
+        raise
+
+    queries, embeddings = await _planned_queries(question, plan, question_embedding)
+    planned_results = await parallel_retrieve(
+        queries=queries,
+        namespace=namespace,
+        top_k=top_k,
+        min_score=min_score,
+        query_embeddings=embeddings,
+    )
+    return plan, deduplicate_results(question_results + planned_results)
+
+
+def _speculative_queries(question: str, plan: QueryPlan) -> List[str]:
+    return [
+        f"{question} {aspect}"
+        for aspect in dict.fromkeys([*plan.queries, *SPECULATIVE_FACETS])
+    ]
+
+
+def _refinement_queries(
+    question: str, plan: QueryPlan, missing_topics: List[str], prefetched: bool
+) -> List[str]:
+    """Targeted queries for up to three missing topics.
+
+    Queries already searched (the question, the plan and, when ``prefetched``,
+    the speculative prefetch) are dropped, as are repeats, so each one costs a
+    single embedding + search.
+    """
+
+    seen = {question, *_retrieval_queries(question, plan)}
+    if prefetched:
+        seen.update(_speculative_queries(question, plan))
+    candidates = dict.fromkeys(
+        query
+        for topic in missing_topics[:3]
+        for query in (f"{question} {topic}", topic)
+    )
+    return [query for query in candidates if query not in seen]
+
+
+async def _targeted_queries(
+    question: str, plan: QueryPlan, missing_topics: List[str], prefetched: bool
+) -> Tuple[List[str], List[List[float]]]:
+    """Refinement queries (and embeddings) the speculative prefetch did not already cover.
+
+    ``prefetched`` says whether the prefetch returned anything; a failed
+    prefetch covers nothing, so then every refinement query is searched.
+    """
+
+    queries = _refinement_queries(question, plan, missing_topics, prefetched)
+    if not queries:
+        return [], []
+    covered = _speculative_queries(question, plan) if prefetched else []
+    embeddings = await asyncio.to_thread(embed_queries, [*covered, *queries])
+    return _drop_near_duplicates(
+        queries, embeddings[len(covered) :], embeddings[: len(covered)]
     )
 
-    system_prompt = f"""You are a knowledgeable documentation assistant helping users understand and use this product effectively. Your goal is to provide accurate, helpful answers that empower users to accomplish their tasks.
+
+def _with_citations(response: Any, citations: List[Citation]) -> DocAnswer:
+    """Normalise an ``ai()`` response into a DocAnswer carrying ``citations``.
+
+    Parsed DocAnswers are copied without re-validation; raw dicts are
+    validated once, and foreign models round-trip through JSON so pydantic-core
+    validates them without building an intermediate dict. ``citations`` were
+    built here from validated results, so they are attached afterwards rather
+    than validated again with the LLM's fields.
+    """
+
+    if isinstance(response, DocAnswer):
+        if response.citations:
+            return response
+        return response.model_copy(update={"citations": citations})
+    if isinstance(response, dict):
+        answer = DocAnswer.model_validate({**response, "citations": []})
+        return answer.model_copy(update={"citations": citations})
+    answer = DocAnswer.model_validate_json(response.model_dump_json())
+    return answer.model_copy(update={"citations": citations})
+
+
+async def _speculative_retrieve(
+    question: str,
+    plan: QueryPlan,
+    namespace: str,
+    top_k: int,
+    min_score: float,
+) -> List[RetrievalResult]:
+    """Prefetch likely refinement context while the first synthesis runs.
+
+    Refinement queries are shaped ``"{question} {topic}"``; the missing topics
+    are only known after synthesis, so the plan's queries and the usual
+    gaps (details, examples, configuration) stand in for them. Failures only
+    cost the prefetch, never the answer.
+    """
+
+    try:
+        return await parallel_retrieve(
+            queries=_speculative_queries(question, plan),
+            namespace=namespace,
+            top_k=top_k,
+            min_score=min_score,
+        )
+    except Exception as exc:
+        log_info(f"[qa] Speculative refinement retrieval failed: {exc}")
+        return []
+
+
+# System prompts are fixed per mode; everything that varies per request
+# (source keys, context, the refinement note) lives in the user prompt, so
+# first-pass and refinement calls share a byte-identical system prompt that
+# providers with prompt caching can reuse.
+_CHUNK_SYSTEM_PROMPT = f"""You are a knowledgeable documentation assistant helping users understand and use this product effectively. Your goal is to provide accurate, helpful answers that empower users to accomplish their tasks.
 
 ## PRODUCT CONTEXT
 
@@ -59,7 +368,7 @@ Use this context to understand the product's architecture, terminology, and comm
 
 ## CITATION FORMAT (CRITICAL)
 
-You have access to these source keys: {', '.join(citation_keys)}
+Use the source keys listed under **Available Sources** in the user message.
 
 **How to cite in your answer text:**
 - Write the citation key wrapped in square brackets: [A], [B], [C], etc.
@@ -124,155 +433,10 @@ After generating your answer, honestly evaluate its completeness:
 **Set `confidence='insufficient'` and `needs_more=True` when:**
 - After thoroughly reading all documentation, the requested information isn't present
 - The question asks about features/topics not covered in the docs
-- Specify what information would be needed in `missing_topics`
-
-{"**Refinement Mode:** This is a second retrieval attempt. If you have useful information—even if not complete—provide it and set `needs_more=False` to avoid retrieval loops." if is_refinement else ""}"""
-
-    user_prompt = f"""Question: {question}
-
-## Available Sources (use these keys for citations)
-
-{key_map}
-
-## Context Chunks
-
-{context_text}
-
----
-
-Generate a concise markdown answer with inline citations [A], [B], etc. after each factual claim.
-Leave the `citations` array empty in your response - the system will inject citation metadata automatically.
-Then self-assess and set confidence, needs_more, and missing_topics accordingly."""
-
-    response = await qa_router.ai(
-        system=system_prompt,
-        user=user_prompt,
-        schema=DocAnswer,
-    )
-
-    if isinstance(response, DocAnswer):
-        if not response.citations:
-            response.citations = citations
-        return response
-
-    response_dict = response if isinstance(response, dict) else response.model_dump()
-    response_dict["citations"] = citations
-    return DocAnswer.model_validate(response_dict)
-
-
-@qa_router.reasoner()
-async def qa_answer(
-    question: str,
-    namespace: str = "website-docs",
-    top_k: int = 6,
-    min_score: float = 0.35,
-) -> DocAnswer:
-    """
-    Main QA orchestrator with parallel retrieval and optional refinement.
-    """
-
-    log_info(f"[qa_answer] Processing question: {question}")
-
-    plan = await plan_queries(question)
-    log_info(
-        f"[qa_answer] Generated {len(plan.queries)} queries with strategy: {plan.strategy}"
-    )
-
-    results = await parallel_retrieve(
-        queries=plan.queries,
-        namespace=namespace,
-        top_k=top_k,
-        min_score=min_score,
-    )
-
-    answer = await synthesize_answer(question, results, is_refinement=False)
-
-    log_info(
-        f"[qa_answer] First synthesis: confidence={answer.confidence}, "
-        f"needs_more={answer.needs_more}, citations={len(answer.citations)}"
-    )
-
-    if answer.needs_more and answer.missing_topics:
-        log_info(f"[qa_answer] Refinement needed for: {answer.missing_topics}")
-
-        refinement_queries = []
-        for topic in answer.missing_topics[:3]:
-            refinement_queries.append(f"{question} {topic}")
-            refinement_queries.append(topic)
-
-        additional_results = await parallel_retrieve(
-            queries=refinement_queries,
-            namespace=namespace,
-            top_k=top_k,
-            min_score=min_score,
-        )
-
-        all_results = results + additional_results
-        merged_results = deduplicate_results(all_results)
-
-        log_info(
-            f"[qa_answer] Refinement retrieved {len(additional_results)} new chunks, "
-            f"merged to {len(merged_results)} total"
-        )
-
-        answer = await synthesize_answer(question, merged_results, is_refinement=True)
-
-        log_info(
-            f"[qa_answer] Refined synthesis: confidence={answer.confidence}, "
-            f"needs_more={answer.needs_more}, citations={len(answer.citations)}"
-        )
-
-    return answer
-
-
-@qa_router.reasoner()
-async def qa_answer_with_documents(
-    question: str,
-    namespace: str = "website-docs",
-    top_k: int = 6,
-    min_score: float = 0.35,
-    top_documents: int = 5,
-) -> DocAnswer:
-    """
-    Document-aware QA orchestrator that retrieves full documents instead of chunks.
-    """
-
-    log_info(f"[qa_answer_with_documents] Processing question: {question}")
-
-    plan = await plan_queries(question)
-    log_info(
-        f"[qa_answer_with_documents] Generated {len(plan.queries)} queries with strategy: {plan.strategy}"
-    )
-
-    chunk_results = await parallel_retrieve(
-        queries=plan.queries,
-        namespace=namespace,
-        top_k=top_k,
-        min_score=min_score,
-    )
-
-    global_memory = qa_router.memory.global_scope
-    documents = await aggregate_chunks_to_documents(
-        global_memory, chunk_results, top_n=top_documents
-    )
-
-    if not documents:
-        return DocAnswer(
-            answer="I could not find any relevant documentation to answer this question.",
-            citations=[],
-            confidence="insufficient",
-            needs_more=False,
-            missing_topics=["No documentation found for this topic"],
-        )
-
-    context_text = format_documents_for_synthesis(documents)
-    citations = build_citations_from_documents(documents)
+- Specify what information would be needed in `missing_topics`"""
 
-    # Build citation key reference for the prompt
-    citation_keys = [c.key for c in citations]
-    key_map = "\n".join([f"  {c.key}: {c.relative_path}" for c in citations])
 
-    system_prompt = f"""You are a knowledgeable documentation assistant helping users understand and use this product effectively. Your goal is to provide accurate, helpful answers by thoroughly reading and comprehending the full documentation pages provided.
+_DOCUMENT_SYSTEM_PROMPT = f"""You are a knowledgeable documentation assistant helping users understand and use this product effectively. Your goal is to provide accurate, helpful answers by thoroughly reading and comprehending the full documentation pages provided.
 
 ## PRODUCT CONTEXT
 
@@ -282,7 +446,7 @@ Use this context to understand the product's architecture, terminology, and comm
 
 ## CITATION FORMAT (CRITICAL)
 
-You have access to these source keys: {', '.join(citation_keys)}
+Use the source keys listed under **Available Sources** in the user message.
 
 **How to cite in your answer text:**
 - Write the citation key wrapped in square brackets: [A], [B], [C], etc.
@@ -377,116 +541,305 @@ After generating your answer, honestly evaluate its completeness:
 - The question asks about features/topics not covered in the docs
 - Specify what information would be needed in `missing_topics`"""
 
-    user_prompt = f"""Question: {question}
+_REFINEMENT_NOTE = "**Refinement Mode:** This is a second retrieval attempt. If you have useful information—even if not complete—provide it and set `needs_more=False` to avoid retrieval loops.\n\n"
 
-## Available Sources (use these keys for citations)
+# Fixed closing instructions of every synthesis user prompt.
+_ANSWER_INSTRUCTIONS = """Generate a concise markdown answer with inline citations [A], [B], etc. after each factual claim.
+Leave the `citations` array empty in your response - the system will inject citation metadata automatically.
+Then self-assess and set confidence, needs_more, and missing_topics accordingly."""
 
-{key_map}
 
-## Full Documentation Pages
+def _synthesis_prompt(
+    question: str,
+    key_map: str,
+    context_heading: str,
+    context_text: str,
+    is_refinement: bool,
+) -> str:
+    """Assemble a synthesis user prompt around the per-request parts."""
+
+    return "".join(
+        (
+            "Question: ",
+            question,
+            "\n\n## Available Sources (use these keys for citations)\n\n",
+            key_map,
+            "\n\n## ",
+            context_heading,
+            "\n\n",
+            context_text,
+            "\n\n---\n\n",
+            _REFINEMENT_NOTE if is_refinement else "",
+            _ANSWER_INSTRUCTIONS,
+        )
+    )
 
-{context_text}
 
----
+@qa_router.reasoner()
+async def synthesize_answer(
+    question: str,
+    results: List[RetrievalResult],
+    is_refinement: bool = False,
+) -> DocAnswer:
+    """Generate answer with self-assessment of completeness."""
 
-Generate a concise markdown answer with inline citations [A], [B], etc. after each factual claim.
-Leave the `citations` array empty in your response - the system will inject citation metadata automatically.
-Then self-assess and set confidence, needs_more, and missing_topics accordingly."""
+    if not results:
+        return DocAnswer(
+            answer="I could not find any relevant documentation to answer this question.",
+            citations=[],
+            confidence="insufficient",
+            needs_more=False,
+            missing_topics=["No documentation found for this topic"],
+        )
+
+    context_text = format_context_for_synthesis(results)
+    citations = build_citations(results)
+
+    # Build citation key reference for the prompt
+    key_map = "\n".join(
+        [f"  {c.key}: {c.relative_path}:{c.start_line}-{c.end_line}" for c in citations]
+    )
 
     response = await qa_router.ai(
-        system=system_prompt,
-        user=user_prompt,
+        system=_CHUNK_SYSTEM_PROMPT,
+        user=_synthesis_prompt(
+            question, key_map, "Context Chunks", context_text, is_refinement
+        ),
         schema=DocAnswer,
     )
 
-    if isinstance(response, DocAnswer):
-        if not response.citations:
-            response.citations = citations
-        answer = response
-    else:
-        response_dict = (
-            response if isinstance(response, dict) else response.model_dump()
-        )
-        response_dict["citations"] = citations
-        answer = DocAnswer.model_validate(response_dict)
+    return _with_citations(response, citations)
 
+
+@qa_router.reasoner()
+async def qa_answer(
+    question: str,
+    namespace: str = "website-docs",
+    top_k: int = 6,
+    min_score: float = 0.35,
+) -> DocAnswer:
+    """
+    Main QA orchestrator with parallel retrieval and optional refinement.
+    """
+
+    return await _semantic_cached(
+        ("qa_answer", namespace, top_k, min_score, 0),
+        question,
+        lambda embedding: _answer_with_chunks(
+            question, embedding, namespace, top_k, min_score
+        ),
+    )
+
+
+async def _answer_with_chunks(
+    question: str,
+    question_embedding: Optional[List[float]],
+    namespace: str,
+    top_k: int,
+    min_score: float,
+) -> DocAnswer:
+    log_info(f"[qa_answer] Processing question: {question}")
+
+    plan, results = await _shared_retrieve_while_planning(
+        question, question_embedding, namespace, top_k, min_score
+    )
     log_info(
-        f"[qa_answer_with_documents] First synthesis: confidence={answer.confidence}, "
-        f"needs_more={answer.needs_more}, documents_used={len(documents)}"
+        f"[qa_answer] Generated {len(plan.queries)} queries with strategy: {plan.strategy}"
     )
 
-    if answer.needs_more and answer.missing_topics:
+    speculative = asyncio.ensure_future(
+        _speculative_retrieve(question, plan, namespace, top_k, min_score)
+    )
+    try:
+        answer = await synthesize_answer(question, results, is_refinement=False)
+
         log_info(
-            f"[qa_answer_with_documents] Refinement needed for: {answer.missing_topics}"
+            f"[qa_answer] First synthesis: confidence={answer.confidence}, "
+            f"needs_more={answer.needs_more}, citations={len(answer.citations)}"
         )
 
-        refinement_queries = []
-        for topic in answer.missing_topics[:3]:
-            refinement_queries.append(f"{question} {topic}")
-            refinement_queries.append(topic)
+        if answer.needs_more and answer.missing_topics:
+            log_info(f"[qa_answer] Refinement needed for: {answer.missing_topics}")
 
-        additional_chunks = await parallel_retrieve(
-            queries=refinement_queries,
-            namespace=namespace,
-            top_k=top_k,
-            min_score=min_score,
-        )
+            speculative_results = await speculative
+            refinement_queries, refinement_embeddings = await _targeted_queries(
+                question, plan, answer.missing_topics, bool(speculative_results)
+            )
+            additional_results = await parallel_retrieve(
+                queries=refinement_queries,
+                namespace=namespace,
+                top_k=top_k,
+                min_score=min_score,
+                query_embeddings=refinement_embeddings,
+                exclude_sources=[r.source for r in results + speculative_results],
+            )
 
-        all_chunks = chunk_results + additional_chunks
-        merged_documents = await aggregate_chunks_to_documents(
-            global_memory, all_chunks, top_n=top_documents
-        )
+            all_results = results + speculative_results + additional_results
+            merged_results = deduplicate_results(all_results)
 
-        log_info(
-            f"[qa_answer_with_documents] Refinement found {len(merged_documents)} total documents"
-        )
+            log_info(
+                f"[qa_answer] Refinement retrieved {len(additional_results)} new chunks "
+                f"({len(speculative_results)} prefetched), "
+                f"merged to {len(merged_results)} total"
+            )
 
-        context_text = format_documents_for_synthesis(merged_documents)
-        citations = build_citations_from_documents(merged_documents)
-        citation_keys = [c.key for c in citations]
-        key_map = "\n".join([f"  {c.key}: {c.relative_path}" for c in citations])
+            if not {r.source for r in merged_results} - {r.source for r in results}:
+                # Nothing new to read: a second synthesis would see the same context.
+                log_info(
+                    "[qa_answer] Refinement found no new sources, keeping first answer"
+                )
+                answer.needs_more = False
+                return answer
 
-        system_prompt_refined = (
-            system_prompt
-            + "\n\n**REFINEMENT MODE:** This is a second retrieval attempt. If you have useful information—even if not complete—provide it and set `needs_more=False` to avoid retrieval loops."
-        )
+            answer = await synthesize_answer(
+                question, merged_results, is_refinement=True
+            )
 
-        user_prompt_refined = f"""Question: {question}
+            log_info(
+                f"[qa_answer] Refined synthesis: confidence={answer.confidence}, "
+                f"needs_more={answer.needs_more}, citations={len(answer.citations)}"
+            )
 
-## Available Sources (use these keys for citations)
+        return answer
+    finally:
+        if not speculative.done():
+            speculative.cancel()
 
-{key_map}
 
-## Full Documentation Pages
+@qa_router.reasoner()
+async def qa_answer_with_documents(
+    question: str,
+    namespace: str = "website-docs",
+    top_k: int = 6,
+    min_score: float = 0.35,
+    top_documents: int = 5,
+) -> DocAnswer:
+    """
+    Document-aware QA orchestrator that retrieves full documents instead of chunks.
+    """
 
-{context_text}
+    return await _semantic_cached(
+        ("qa_answer_with_documents", namespace, top_k, min_score, top_documents),
+        question,
+        lambda embedding: _answer_with_documents(
+            question, embedding, namespace, top_k, min_score, top_documents
+        ),
+    )
 
----
 
-Generate a concise markdown answer with inline citations [A], [B], etc. after each factual claim.
-Leave the `citations` array empty in your response - the system will inject citation metadata automatically.
-Then self-assess and set confidence, needs_more, and missing_topics accordingly."""
+async def _answer_with_documents(
+    question: str,
+    question_embedding: Optional[List[float]],
+    namespace: str,
+    top_k: int,
+    min_score: float,
+    top_documents: int,
+) -> DocAnswer:
+    log_info(f"[qa_answer_with_documents] Processing question: {question}")
+
+    plan, chunk_results = await _shared_retrieve_while_planning(
+        question, question_embedding, namespace, top_k, min_score
+    )
+    log_info(
+        f"[qa_answer_with_documents] Generated {len(plan.queries)} queries with strategy: {plan.strategy}"
+    )
+
+    speculative = asyncio.ensure_future(
+        _speculative_retrieve(question, plan, namespace, top_k, min_score)
+    )
+    try:
+        global_memory = qa_router.memory.global_scope
+        documents = await aggregate_chunks_to_documents(
+            global_memory, chunk_results, top_n=top_documents, query=question
+        )
+
+        if not documents:
+            return DocAnswer(
+                answer="I could not find any relevant documentation to answer this question.",
+                citations=[],
+                confidence="insufficient",
+                needs_more=False,
+                missing_topics=["No documentation found for this topic"],
+            )
+
+        context_text = format_documents_for_synthesis(documents)
+        citations = build_citations_from_documents(documents)
+
+        # Build citation key reference for the prompt
+        key_map = "\n".join([f"  {c.key}: {c.relative_path}" for c in citations])
 
         response = await qa_router.ai(
-            system=system_prompt_refined,
-            user=user_prompt_refined,
+            system=_DOCUMENT_SYSTEM_PROMPT,
+            user=_synthesis_prompt(
+                question, key_map, "Full Documentation Pages", context_text, False
+            ),
             schema=DocAnswer,
         )
 
-        if isinstance(response, DocAnswer):
-            if not response.citations:
-                response.citations = citations
-            answer = response
-        else:
-            response_dict = (
-                response if isinstance(response, dict) else response.model_dump()
-            )
-            response_dict["citations"] = citations
-            answer = DocAnswer.model_validate(response_dict)
+        answer = _with_citations(response, citations)
 
         log_info(
-            f"[qa_answer_with_documents] Refined synthesis: confidence={answer.confidence}, "
-            f"needs_more={answer.needs_more}, documents_used={len(merged_documents)}"
+            f"[qa_answer_with_documents] First synthesis: confidence={answer.confidence}, "
+            f"needs_more={answer.needs_more}, documents_used={len(documents)}"
         )
 
-    return answer
+        if answer.needs_more and answer.missing_topics:
+            log_info(
+                f"[qa_answer_with_documents] Refinement needed for: {answer.missing_topics}"
+            )
+
+            speculative_chunks = await speculative
+            refinement_queries, refinement_embeddings = await _targeted_queries(
+                question, plan, answer.missing_topics, bool(speculative_chunks)
+            )
+            additional_chunks = await parallel_retrieve(
+                queries=refinement_queries,
+                namespace=namespace,
+                top_k=top_k,
+                min_score=min_score,
+                query_embeddings=refinement_embeddings,
+                exclude_sources=[c.source for c in chunk_results + speculative_chunks],
+            )
+
+            all_chunks = chunk_results + speculative_chunks + additional_chunks
+            merged_documents = await aggregate_chunks_to_documents(
+                global_memory, all_chunks, top_n=top_documents, query=question
+            )
+
+            log_info(
+                f"[qa_answer_with_documents] Refinement found {len(merged_documents)} total documents"
+            )
+
+            if {d.document_key for d in merged_documents} <= {
+                d.document_key for d in documents
+            }:
+                # Same pages as the first pass: re-synthesizing would not add evidence.
+                log_info(
+                    "[qa_answer_with_documents] Refinement found no new documents, keeping first answer"
+                )
+                answer.needs_more = False
+                return answer
+
+            context_text = format_documents_for_synthesis(merged_documents)
+            citations = build_citations_from_documents(merged_documents)
+            key_map = "\n".join([f"  {c.key}: {c.relative_path}" for c in citations])
+
+            response = await qa_router.ai(
+                system=_DOCUMENT_SYSTEM_PROMPT,
+                user=_synthesis_prompt(
+                    question, key_map, "Full Documentation Pages", context_text, True
+                ),
+                schema=DocAnswer,
+            )
+
+            answer = _with_citations(response, citations)
+
+            log_info(
+                f"[qa_answer_with_documents] Refined synthesis: confidence={answer.confidence}, "
+                f"needs_more={answer.needs_more}, documents_used={len(merged_documents)}"
+            )
+
+        return answer
+    finally:
+        if not speculative.done():
+            speculative.cancel()
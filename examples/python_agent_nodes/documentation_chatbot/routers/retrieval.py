@@ -3,34 +3,90 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+from typing import AbstractSet, Dict, List, Optional
 
 from agentfield import AgentRouter
 from agentfield.logger import log_info
 
-from embedding import embed_query
+from embedding import embed_queries
+from local_index import load_index
 from pipeline_utils import deduplicate_results, filter_hits
 from schemas import RetrievalResult
 
 retrieval_router = AgentRouter(tags=["retrieval"])
 
 
-async def _retrieve_for_query(
+# Flipped off the first time the control plane rejects the batch endpoint
+# (older servers), after which searches go out one request per query.
+_batch_search_supported = True
+
+
+async def _search_all(
     global_memory,
-    query: str,
+    embeddings: List[List[float]],
+    namespace: str,
+    top_k: int,
+) -> List[List[Dict]]:
+    """Run one similarity search per embedding, batched into one request if possible."""
+
+    global _batch_search_supported
+
+    # Scope the search to the namespace server-side so the top_k * 2 candidate
+    # window is not spent on other namespaces' chunks.
+    filters = {"namespace": namespace}
+    search_batch = getattr(global_memory, "similarity_search_batch", None)
+    if _batch_search_supported and search_batch is not None:
+        try:
+            return await search_batch(
+                query_embeddings=embeddings, top_k=top_k * 2, filters=filters
+            )
+        except Exception as exc:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if status not in (404, 405):
+                raise
+            _batch_search_supported = False
+            log_info(
+                "[parallel_retrieve] Batch vector search unavailable, "
+                "falling back to one request per query"
+            )
+
+    return await asyncio.gather(
+        *(
+            global_memory.similarity_search(
+                query_embedding=embedding, top_k=top_k * 2, filters=filters
+            )
+            for embedding in embeddings
+        )
+    )
+
+
+def _hit_source(metadata: Dict) -> str:
+    relative_path = metadata.get("relative_path", "unknown")
+    start_line = int(metadata.get("start_line", 0))
+    end_line = int(metadata.get("end_line", 0))
+    return f"{relative_path}:{start_line}-{end_line}"
+
+
+def _hits_to_results(
+    raw_hits: List[Dict],
     namespace: str,
     top_k: int,
     min_score: float,
+    exclude_sources: AbstractSet[str] = frozenset(),
 ) -> List[RetrievalResult]:
-    """Single retrieval operation for one query."""
+    """Convert the raw hits of one query into retrieval results.
 
-    embedding = embed_query(query)
-
-    raw_hits = await global_memory.similarity_search(
-        query_embedding=embedding, top_k=top_k * 2
-    )
+    Hits for ``exclude_sources`` are dropped before the ``top_k`` cut, so
+    their slots go to the next-best chunks in the candidate window.
+    """
 
     filtered_hits = filter_hits(raw_hits, namespace=namespace, min_score=min_score)
+    if exclude_sources:
+        filtered_hits = [
+            hit
+            for hit in filtered_hits
+            if _hit_source(hit.get("metadata", {})) not in exclude_sources
+        ]
 
     results: List[RetrievalResult] = []
     for hit in filtered_hits[:top_k]:
@@ -39,15 +95,12 @@ async def _retrieve_for_query(
         if not text:
             continue
 
-        relative_path = metadata.get("relative_path", "unknown")
-        start_line = int(metadata.get("start_line", 0))
-        end_line = int(metadata.get("end_line", 0))
-        source = f"{relative_path}:{start_line}-{end_line}"
-
+        # Every field is already of its declared type, so skip validation
+        # (which would also copy each hit's metadata dict).
         results.append(
-            RetrievalResult(
+            RetrievalResult.model_construct(
                 text=text,
-                source=source,
+                source=_hit_source(metadata),
                 score=float(hit.get("score", 0.0)),
                 metadata=metadata,
             )
@@ -62,21 +115,43 @@ async def parallel_retrieve(
     namespace: str = "website-docs",
     top_k: int = 6,
     min_score: float = 0.35,
+    query_embeddings: Optional[List[List[float]]] = None,
+    exclude_sources: Optional[List[str]] = None,
 ) -> List[RetrievalResult]:
-    """Execute parallel retrieval for all queries and deduplicate results."""
+    """Execute parallel retrieval for all queries and deduplicate results.
+
+    Callers that already embedded ``queries`` can pass the vectors (one per
+    query, in order) as ``query_embeddings`` to skip embedding them again.
+    Chunks whose ``source`` is in ``exclude_sources`` (ones the caller
+    already holds) are skipped, and each query returns up to ``top_k`` other
+    chunks instead.
+    """
+
+    if not queries:
+        return []
 
     log_info(f"[parallel_retrieve] Running {len(queries)} queries in parallel")
     global_memory = retrieval_router.memory.global_scope
 
-    tasks = [
-        _retrieve_for_query(global_memory, query, namespace, top_k, min_score)
-        for query in queries
-    ]
-    all_results_lists = await asyncio.gather(*tasks)
+    embeddings = (
+        query_embeddings
+        if query_embeddings is not None
+        else await asyncio.to_thread(embed_queries, queries)
+    )
+    local_index = await asyncio.to_thread(load_index, namespace)
+    if local_index is not None:
+        hits_per_query = await asyncio.to_thread(
+            local_index.search, embeddings, top_k * 2
+        )
+    else:
+        hits_per_query = await _search_all(global_memory, embeddings, namespace, top_k)
 
+    excluded = frozenset(exclude_sources or ())
     all_results: List[RetrievalResult] = []
-    for results in all_results_lists:
-        all_results.extend(results)
+    for raw_hits in hits_per_query:
+        all_results.extend(
+            _hits_to_results(raw_hits, namespace, top_k, min_score, excluded)
+        )
 
     log_info(
         f"[parallel_retrieve] Retrieved {len(all_results)} total chunks before deduplication"
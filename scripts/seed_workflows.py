@@ -8,21 +8,51 @@ steps, and timeline events so they show up inside the control-plane UI
 
 Example:
     python scripts/seed_workflows.py --nodes-per-workflow 10000 --workflow-count 1
+
+Only the standard library is required; if ``orjson`` is installed it is used
+to serialize the JSON payloads, which is noticeably faster on large seeds.
 """
 
 from __future__ import annotations
 
 import argparse
+import calendar
 import json
+import os
 import random
 import sqlite3
 import sys
 import textwrap
+import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    dumps_json = orjson.dumps
+else:
+
+    def dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 
 # --- Data classes ---------------------------------------------------------
@@ -63,14 +93,19 @@ class NodeRecord:
     execution_id: str
     request_id: str
     parent_execution_id: Optional[str]
+    parent_index: Optional[int]  # position of the parent in the workflow's node list
     depth: int
     agent_node_id: str
     reasoner_id: str
     status: str
     status_reason: Optional[str]
     error_message: Optional[str]
-    started_at: datetime
-    completed_at: datetime
+    # Whole UTC epoch seconds, so child start times are plain integer sums.
+    started_epoch: int
+    completed_epoch: int
+    # The same instants pre-formatted for the TEXT columns every table repeats.
+    started_iso: str
+    completed_iso: str
     duration_ms: int
     input_payload: dict
     output_payload: dict
@@ -81,6 +116,20 @@ class NodeRecord:
 
 DEFAULT_DB_PATH = Path("~/.agentfield/data/agentfield.db").expanduser()
 
+# Connection settings for one bulk write. They match the control plane's own
+# DSN (WAL, synchronous=NORMAL) rather than weakening durability or taking an
+# exclusive lock on a database a running server may share; the large page
+# cache and in-memory temp store keep index maintenance off disk.
+SEED_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -262144;
+PRAGMA mmap_size = 268435456;
+PRAGMA busy_timeout = 30000;
+PRAGMA foreign_keys = ON;
+"""
+
 AGENT_NODE_POOL: Tuple[AgentNodeDefinition, ...] = (
     AgentNodeDefinition(
         node_id="atlas_scope_orchestrator",
@@ -370,6 +419,140 @@ DELIVERABLES = (
     "cx_opportunity_brief",
 )
 
+FOCUS_AREAS = (
+    "supply_chain",
+    "policy_shift",
+    "funding_rounds",
+    "sentiment_trace",
+    "talent_flows",
+)
+
+ANALYSTS = ("analyst_jonah", "analyst_li", "analyst_manuela", "analyst_mira")
+
+# Execution event payloads never vary, so they are serialized once.
+EVENT_STARTED_PAYLOAD = dumps_json({"detail": "Execution started"}).decode()
+EVENT_COMPLETED_PAYLOAD = dumps_json({"detail": "Execution completed"}).decode()
+EVENT_FAILED_PAYLOAD = dumps_json({"detail": "Execution failed"}).decode()
+
+# Run event payloads: two fixed ones and one per possible deliverable.
+RUN_STARTED_PAYLOAD = dumps_json({"kickoff": "approved"}).decode()
+RUN_CHECKPOINT_PAYLOAD = dumps_json({"progress": 0.55}).decode()
+RUN_COMPLETED_PAYLOADS = {
+    deliverable: dumps_json({"deliverable": deliverable}).decode()
+    for deliverable in DELIVERABLES
+}
+
+# The JSON columns of each AGENT_NODE_POOL entry, in pool order: reasoners,
+# skills, communication_config, features, metadata.
+AGENT_NODE_JSON = tuple(
+    (
+        dumps_json(node.reasoners),
+        dumps_json(node.skills),
+        dumps_json(node.communication),
+        dumps_json(node.features or {}),
+        dumps_json(node.metadata or {}),
+    )
+    for node in AGENT_NODE_POOL
+)
+
+# Every step shares this metadata BLOB; bytes bind directly, so no wrapper
+# (memoryview binds through the same buffer path, only slower).
+EMPTY_JSON_BLOB = b"{}"
+
+
+# --- SQL ------------------------------------------------------------------
+
+# Statement texts are fixed so sqlite3's per-connection statement cache
+# prepares each one once for the whole run.
+
+WORKFLOW_INSERT_SQL = """
+    INSERT INTO workflows (
+        workflow_id, workflow_name, workflow_tags, session_id, actor_id,
+        parent_workflow_id, parent_execution_id, root_workflow_id,
+        workflow_depth, total_executions, successful_executions, failed_executions,
+        total_duration_ms, status, started_at, completed_at, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+WORKFLOW_RUN_INSERT_SQL = """
+    INSERT INTO workflow_runs (
+        run_id, root_workflow_id, root_execution_id, status, total_steps,
+        completed_steps, failed_steps, state_version, last_event_sequence,
+        metadata, created_at, updated_at, completed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+WORKFLOW_EXECUTION_INSERT_SQL = """
+    INSERT INTO workflow_executions (
+        workflow_id, execution_id, agentfield_request_id, run_id, session_id,
+        actor_id, agent_node_id, parent_workflow_id, parent_execution_id,
+        root_workflow_id, workflow_depth, reasoner_id, input_data, output_data,
+        input_size, output_size, workflow_name, workflow_tags, status,
+        started_at, completed_at, duration_ms, state_version, last_event_sequence,
+        active_children, pending_children, pending_terminal_status, status_reason,
+        lease_owner, lease_expires_at, error_message, retry_count, notes, created_at,
+        updated_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+WORKFLOW_EXECUTION_EVENT_INSERT_SQL = """
+    INSERT INTO workflow_execution_events (
+        execution_id, workflow_id, run_id, parent_execution_id, sequence,
+        previous_sequence, event_type, status, status_reason, payload,
+        emitted_at, recorded_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+WORKFLOW_STEP_INSERT_SQL = """
+    INSERT INTO workflow_steps (
+        step_id, run_id, parent_step_id, execution_id, agent_node_id, target,
+        status, attempt, priority, not_before, input_uri, result_uri, error_message,
+        metadata, started_at, completed_at, leased_at, lease_timeout, created_at,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+WORKFLOW_RUN_EVENT_INSERT_SQL = """
+    INSERT INTO workflow_run_events (
+        run_id, sequence, previous_sequence, event_type, status,
+        status_reason, payload, emitted_at, recorded_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# executions holds a narrower copy of each workflow_executions row, so it is
+# filled by copying the run's rows inside SQLite rather than from Python.
+EXECUTION_INSERT_SQL = """
+    INSERT INTO executions (
+        execution_id, run_id, parent_execution_id, agent_node_id, reasoner_id,
+        node_id, status, input_payload, result_payload, error_message,
+        input_uri, result_uri, session_id, actor_id, started_at, completed_at,
+        duration_ms, created_at, updated_at
+    )
+    SELECT
+        execution_id, run_id, parent_execution_id, agent_node_id, reasoner_id,
+        agent_node_id, status, input_data, output_data, error_message,
+        NULL, NULL, session_id, actor_id, started_at, completed_at,
+        duration_ms, created_at, updated_at
+    FROM workflow_executions
+    WHERE run_id = ?
+"""
+
+
+# Tables insert_workflow_rows writes, in its order; copying them in this order
+# also satisfies their foreign keys.
+SEEDED_TABLES = (
+    "workflows",
+    "workflow_runs",
+    "workflow_executions",
+    "workflow_execution_events",
+    "workflow_steps",
+    "workflow_run_events",
+    "executions",
+)
+
 
 # --- Helpers --------------------------------------------------------------
 
@@ -383,7 +566,10 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
             Tips:
               • Use --nodes-per-workflow 10000 to mirror dense research DAGs.
               • Combine --workflow-count with a smaller node count to simulate breadth.
+              • Add --workers N to build many workflows on N processes.
               • Re-run with the same --seed to get reproducible structures.
+              • Seeding runs in WAL mode, so the UI keeps reading while rows land;
+                expect agentfield.db-wal / agentfield.db-shm next to the database.
             """
         ),
     )
@@ -453,6 +639,20 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         default=None,
         help="Random seed for deterministic output.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes that synthesize workflows in parallel; writes stay on one "
+        "connection (default: 1, build in-process).",
+    )
+    parser.add_argument(
+        "--in-memory-build",
+        action="store_true",
+        help="Build every row in an in-memory database first and copy it over in "
+        "one short write transaction, so control-plane writers only wait for the "
+        "copy. Holds all seeded rows in memory.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -461,89 +661,140 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the bulk-load PRAGMAs; must run outside a transaction."""
+    conn.executescript(SEED_PRAGMAS)
+
+
 def ensure_agent_nodes(conn: sqlite3.Connection, team_id: str) -> None:
     """Upsert the canned agent nodes so UI views have metadata."""
     now_iso = isoformat(datetime.utcnow())
-    for node in AGENT_NODE_POOL:
-        payload = (
+    payloads = [
+        (
             node.node_id,
             team_id,
             node.base_url,
             node.version,
             node.deployment_type,
             node.invocation_url,
-            json.dumps(node.reasoners).encode(),
-            json.dumps(node.skills).encode(),
-            json.dumps(node.communication).encode(),
+            reasoners,
+            skills,
+            communication,
             node.health_status,
             node.lifecycle_status,
             now_iso,
             now_iso,
-            json.dumps(node.features or {}).encode(),
-            json.dumps(node.metadata or {}).encode(),
+            features,
+            metadata,
         )
-        conn.execute("DELETE FROM agent_nodes WHERE id = ?", (node.node_id,))
-        conn.execute(
-            """
-            INSERT INTO agent_nodes (
-                id, team_id, base_url, version, deployment_type, invocation_url,
-                reasoners, skills, communication_config, health_status, lifecycle_status,
-                last_heartbeat, registered_at, features, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            payload,
+        for node, (reasoners, skills, communication, features, metadata) in zip(
+            AGENT_NODE_POOL, AGENT_NODE_JSON
         )
+    ]
+    conn.executemany(
+        """
+        INSERT INTO agent_nodes (
+            id, team_id, base_url, version, deployment_type, invocation_url,
+            reasoners, skills, communication_config, health_status, lifecycle_status,
+            last_heartbeat, registered_at, features, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            team_id = excluded.team_id,
+            base_url = excluded.base_url,
+            version = excluded.version,
+            deployment_type = excluded.deployment_type,
+            invocation_url = excluded.invocation_url,
+            reasoners = excluded.reasoners,
+            skills = excluded.skills,
+            communication_config = excluded.communication_config,
+            health_status = excluded.health_status,
+            lifecycle_status = excluded.lifecycle_status,
+            last_heartbeat = excluded.last_heartbeat,
+            registered_at = excluded.registered_at,
+            features = excluded.features,
+            metadata = excluded.metadata
+        """,
+        payloads,
+    )
 
 
 def purge_workflows_with_prefix(conn: sqlite3.Connection, prefix: str) -> int:
-    """Remove existing data for workflows whose IDs share the prefix."""
-    pattern = f"{prefix}%"
-    workflow_ids = [
-        row[0]
-        for row in conn.execute(
-            "SELECT workflow_id FROM workflows WHERE workflow_id LIKE ?", (pattern,)
-        )
-    ]
-    removed = 0
-    for workflow_id in workflow_ids:
-        run_ids = [
-            row[0]
-            for row in conn.execute(
-                "SELECT run_id FROM workflow_runs WHERE root_workflow_id = ?",
-                (workflow_id,),
-            )
-        ]
-        for run_id in run_ids:
-            conn.execute("DELETE FROM executions WHERE run_id = ?", (run_id,))
-            conn.execute("DELETE FROM workflow_steps WHERE run_id = ?", (run_id,))
-            conn.execute("DELETE FROM workflow_run_events WHERE run_id = ?", (run_id,))
-            conn.execute(
-                "DELETE FROM workflow_execution_events WHERE run_id = ?", (run_id,)
-            )
-        conn.execute(
-            "DELETE FROM workflow_execution_events WHERE workflow_id = ?",
-            (workflow_id,),
-        )
-        conn.execute(
-            "DELETE FROM workflow_executions WHERE workflow_id = ?", (workflow_id,)
-        )
-        conn.execute(
-            "DELETE FROM workflow_runs WHERE root_workflow_id = ?", (workflow_id,)
-        )
-        conn.execute("DELETE FROM workflows WHERE workflow_id = ?", (workflow_id,))
-        removed += 1
-    return removed
+    """Remove existing data for workflows whose IDs share the prefix.
 
+    The matching workflow and run IDs are collected into temp tables first, so
+    each table is cleared by one set-based DELETE instead of one per run.
+    """
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS _purge_workflows (workflow_id TEXT PRIMARY KEY)"
+    )
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS _purge_runs (run_id TEXT PRIMARY KEY)"
+    )
+    conn.execute("DELETE FROM _purge_workflows")
+    conn.execute("DELETE FROM _purge_runs")
+    conn.execute(
+        "INSERT INTO _purge_workflows SELECT workflow_id FROM workflows WHERE workflow_id LIKE ?",
+        (f"{prefix}%",),
+    )
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO _purge_runs
+        SELECT run_id FROM workflow_runs
+        WHERE root_workflow_id IN (SELECT workflow_id FROM _purge_workflows)
+        """
+    )
 
-def choose_weighted(options: Sequence[Tuple[str, float]]) -> str:
+    in_runs = "run_id IN (SELECT run_id FROM _purge_runs)"
+    in_workflows = "IN (SELECT workflow_id FROM _purge_workflows)"
+    conn.execute(f"DELETE FROM executions WHERE {in_runs}")
+    conn.execute(f"DELETE FROM workflow_steps WHERE {in_runs}")
+    conn.execute(f"DELETE FROM workflow_run_events WHERE {in_runs}")
+    conn.execute(f"DELETE FROM workflow_execution_events WHERE {in_runs}")
+    conn.execute(
+        f"DELETE FROM workflow_execution_events WHERE workflow_id {in_workflows}"
+    )
+    conn.execute(f"DELETE FROM workflow_executions WHERE workflow_id {in_workflows}")
+    conn.execute(f"DELETE FROM workflow_runs WHERE root_workflow_id {in_workflows}")
+    return conn.execute(
+        f"DELETE FROM workflows WHERE workflow_id {in_workflows}"
+    ).rowcount
+
+
+def choose_weighted(options: Sequence[Tuple[str, float]], count: int) -> List[str]:
     labels, weights = zip(*options)
-    return random.choices(labels, weights=weights, k=1)[0]
+    return random.choices(labels, weights=weights, k=count)
+
+
+def randints(low: int, high: int, count: int) -> List[int]:
+    """``count`` draws of ``random.randint(low, high)`` in one batched call."""
+    return random.choices(range(low, high + 1), k=count)
 
 
 def isoformat(dt: datetime) -> str:
     return dt.replace(microsecond=0).isoformat()
 
 
+def epoch_seconds(dt: datetime) -> int:
+    """Whole seconds since the epoch for a naive UTC datetime."""
+    return calendar.timegm(dt.utctimetuple())
+
+
+def isoformat_epoch(seconds: int) -> str:
+    """``isoformat`` for epoch seconds, without building a datetime."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def mint_hex_ids(count: int, width: int) -> List[str]:
+    """Return ``count`` random hex strings of ``width`` characters.
+
+    One ``os.urandom`` read backs the whole batch instead of one
+    ``uuid.uuid4()`` (and one urandom syscall) per id.
+    """
+    stride = width + width % 2
+    digits = os.urandom(count * stride // 2).hex()
+    return [digits[i : i + width] for i in range(0, count * stride, stride)]
+
+
 def generate_scenario(
     *,
     prefix: str,
@@ -601,92 +852,112 @@ def synthesize_nodes(
         "summary": "Initial orchestration launched with validated scope.",
         "confidence": round(random.uniform(0.82, 0.95), 2),
     }
+    root_start_iso = isoformat(scenario.started_at)
     root_notes = [
         {
             "author": scenario.actor_id,
             "note": "Scope locked with intelligence leadership.",
-            "timestamp": isoformat(scenario.started_at),
+            "timestamp": root_start_iso,
         }
     ]
 
-    root_end = scenario.started_at + timedelta(minutes=6)
-    root_duration_ms = int((root_end - scenario.started_at).total_seconds() * 1000)
+    root_start = epoch_seconds(scenario.started_at)
+    root_end = root_start + 6 * 60
     nodes.append(
         NodeRecord(
             execution_id=scenario.root_execution_id,
             request_id=scenario.root_request_id,
             parent_execution_id=None,
+            parent_index=None,
             depth=0,
             agent_node_id="atlas_scope_orchestrator",
             reasoner_id=AGENT_NODE_POOL[0].reasoners[0]["id"],
             status="succeeded",
             status_reason=None,
             error_message=None,
-            started_at=scenario.started_at,
-            completed_at=root_end,
-            duration_ms=root_duration_ms,
+            started_epoch=root_start,
+            completed_epoch=root_end,
+            started_iso=root_start_iso,
+            completed_iso=isoformat_epoch(root_end),
+            duration_ms=(root_end - root_start) * 1000,
             input_payload=root_input,
             output_payload=root_output,
             notes=root_notes,
         )
     )
 
+    execution_suffixes = mint_hex_ids(nodes_per_workflow, 10)
+    request_suffixes = mint_hex_ids(nodes_per_workflow, 12)
+    insight_hashes = mint_hex_ids(nodes_per_workflow, 16)
+
+    # Draw every per-node random value up front in batched calls; the loop
+    # below only indexes into these lists.
+    count = nodes_per_workflow
+    # Node i picks its parent uniformly from the i nodes before it.
+    parent_indices = [int(random.random() * k) for k in range(1, count + 1)]
+    statuses = choose_weighted(STATUS_WEIGHTS, count)
+    start_offsets = randints(90, 480, count)
+    durations = randints(120, 1500, count)
+    agent_choices = random.choices(AGENT_NODE_POOL, k=count)
+    reasoner_draws = [random.random() for _ in range(count)]
+    authors = random.choices(ANALYSTS, k=count)
+    focuses = random.choices(FOCUS_AREAS, k=count)
+    signals_processed = randints(12, 120, count)
+    key_findings = randints(3, 8, count)
+    priority_scores = [round(random.uniform(0.32, 0.98), 2) for _ in range(count)]
+
     for i in range(1, nodes_per_workflow + 1):
-        parent_node = random.choice(nodes)
-        status = choose_weighted(STATUS_WEIGHTS)
+        j = i - 1
+        parent_index = parent_indices[j]
+        parent_node = nodes[parent_index]
+        status = statuses[j]
         status_reason = None
         error_message = None
 
-        start_offset = random.randint(90, 480)
-        node_start = parent_node.started_at + timedelta(seconds=start_offset)
-        node_duration = random.randint(120, 1500)
-        node_end = node_start + timedelta(seconds=node_duration)
+        node_start = parent_node.started_epoch + start_offsets[j]
+        node_duration = durations[j]
+        node_end = node_start + node_duration
+        node_end_iso = isoformat_epoch(node_end)
 
-        agent_choice = random.choice(AGENT_NODE_POOL)
-        reasoner_choice = random.choice(agent_choice.reasoners)
+        agent_choice = agent_choices[j]
+        reasoners = agent_choice.reasoners
+        reasoner_choice = reasoners[int(reasoner_draws[j] * len(reasoners))]
 
         notes: List[dict] = []
         notes.append(
             {
-                "author": random.choice(
-                    ["analyst_jonah", "analyst_li", "analyst_manuela", "analyst_mira"]
-                ),
+                "author": authors[j],
                 "note": "Reviewed output and advanced to synthesis track.",
-                "timestamp": isoformat(node_end),
+                "timestamp": node_end_iso,
             }
         )
 
         nodes.append(
             NodeRecord(
-                execution_id=f"exec_{i:05d}_{uuid.uuid4().hex[:10]}",
-                request_id=f"af_req_{uuid.uuid4().hex[:12]}",
+                execution_id=f"exec_{i:05d}_{execution_suffixes[j]}",
+                request_id=f"af_req_{request_suffixes[j]}",
                 parent_execution_id=parent_node.execution_id,
+                parent_index=parent_index,
                 depth=parent_node.depth + 1,
                 agent_node_id=agent_choice.node_id,
                 reasoner_id=reasoner_choice["id"],
                 status=status,
                 status_reason=status_reason,
                 error_message=error_message,
-                started_at=node_start,
-                completed_at=node_end,
+                started_epoch=node_start,
+                completed_epoch=node_end,
+                started_iso=isoformat_epoch(node_start),
+                completed_iso=node_end_iso,
                 duration_ms=node_duration * 1000,
                 input_payload={
-                    "focus": random.choice(
-                        [
-                            "supply_chain",
-                            "policy_shift",
-                            "funding_rounds",
-                            "sentiment_trace",
-                            "talent_flows",
-                        ]
-                    ),
-                    "signals_processed": random.randint(12, 120),
+                    "focus": focuses[j],
+                    "signals_processed": signals_processed[j],
                     "parent_execution": parent_node.execution_id,
                 },
                 output_payload={
-                    "key_findings": random.randint(3, 8),
-                    "priority_score": round(random.uniform(0.32, 0.98), 2),
-                    "insight_hash": uuid.uuid4().hex[:16],
+                    "key_findings": key_findings[j],
+                    "priority_score": priority_scores[j],
+                    "insight_hash": insight_hashes[j],
                 },
                 notes=notes,
             )
@@ -695,267 +966,202 @@ def synthesize_nodes(
     return nodes
 
 
-def insert_workflow(
-    conn: sqlite3.Connection, scenario: WorkflowScenario, nodes: Sequence[NodeRecord]
-) -> None:
-    total_executions = len(nodes)
-    success_count = sum(1 for n in nodes if n.status == "succeeded")
-    failed_count = sum(1 for n in nodes if n.status != "succeeded")
-    max_depth = max(n.depth for n in nodes)
-    workflow_status = "succeeded" if failed_count == 0 else "failed"
-    total_duration_ms = int(
-        (
-            max(n.completed_at for n in nodes) - min(n.started_at for n in nodes)
-        ).total_seconds()
-        * 1000
-    )
-    tags_json = json.dumps(scenario.workflow_tags)
-
-    conn.execute(
-        """
-        INSERT INTO workflows (
-            workflow_id, workflow_name, workflow_tags, session_id, actor_id,
-            parent_workflow_id, parent_execution_id, root_workflow_id,
-            workflow_depth, total_executions, successful_executions, failed_executions,
-            total_duration_ms, status, started_at, completed_at, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
+def _iter_execution_rows(
+    scenario: WorkflowScenario, nodes: Sequence[NodeRecord], tags_json: str
+) -> Iterator[tuple]:
+    for node in nodes:
+        input_blob = dumps_json(node.input_payload)
+        output_blob = dumps_json(node.output_payload)
+        yield (
             scenario.workflow_id,
-            scenario.workflow_name,
-            tags_json,
+            node.execution_id,
+            node.request_id,
+            scenario.run_id,
             scenario.session_id,
             scenario.actor_id,
+            node.agent_node_id,
+            scenario.workflow_id,
+            node.parent_execution_id,
+            scenario.workflow_id,
+            node.depth,
+            node.reasoner_id,
+            input_blob,
+            output_blob,
+            len(input_blob),
+            len(output_blob),
+            scenario.workflow_name,
+            tags_json,
+            node.status,
+            node.started_iso,
+            node.completed_iso,
+            node.duration_ms,
+            1,
+            2,
+            0,
+            0,
             None,
+            node.status_reason,
             None,
-            scenario.workflow_id,
-            max_depth,
-            total_executions,
-            success_count,
-            failed_count,
-            total_duration_ms,
-            workflow_status,
-            isoformat(min(n.started_at for n in nodes)),
-            isoformat(max(n.completed_at for n in nodes)),
-            isoformat(scenario.started_at),
-            isoformat(datetime.utcnow()),
-        ),
-    )
+            None,
+            node.error_message,
+            0,
+            dumps_json(node.notes),
+            node.started_iso,
+            node.completed_iso,
+        )
 
-    run_metadata = {
-        "objective": scenario.workflow_name,
-        "deliverable": random.choice(DELIVERABLES),
-        "regions": list({scenario.workflow_tags[2]}),
-    }
 
-    conn.execute(
-        """
-        INSERT INTO workflow_runs (
-            run_id, root_workflow_id, root_execution_id, status, total_steps,
-            completed_steps, failed_steps, state_version, last_event_sequence,
-            metadata, created_at, updated_at, completed_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
+def _iter_event_rows(
+    scenario: WorkflowScenario, nodes: Sequence[NodeRecord]
+) -> Iterator[tuple]:
+    for node in nodes:
+        yield (
+            node.execution_id,
+            scenario.workflow_id,
             scenario.run_id,
+            node.parent_execution_id,
+            1,
+            0,
+            "status_changed",
+            "running",
+            None,
+            EVENT_STARTED_PAYLOAD,
+            node.started_iso,
+            node.started_iso,
+        )
+        yield (
+            node.execution_id,
             scenario.workflow_id,
-            scenario.root_execution_id,
-            workflow_status,
-            total_executions,
-            success_count,
-            failed_count,
-            3,
-            3,
-            json.dumps(run_metadata).encode(),
-            isoformat(scenario.started_at),
-            isoformat(datetime.utcnow()),
-            isoformat(max(n.completed_at for n in nodes)),
-        ),
-    )
-
-    execution_rows = []
-    event_rows = []
-    step_rows = []
-    step_lookup = {}
-    execution_rows_simple = []
-
-    for node in nodes:
-        notes_payload = json.dumps(node.notes).encode()
-        execution_rows.append(
-            (
-                scenario.workflow_id,
-                node.execution_id,
-                node.request_id,
-                scenario.run_id,
-                scenario.session_id,
-                scenario.actor_id,
-                node.agent_node_id,
-                scenario.workflow_id,
-                node.parent_execution_id,
-                scenario.workflow_id,
-                node.depth,
-                node.reasoner_id,
-                json.dumps(node.input_payload).encode(),
-                json.dumps(node.output_payload).encode(),
-                len(json.dumps(node.input_payload)),
-                len(json.dumps(node.output_payload)),
-                scenario.workflow_name,
-                tags_json,
-                node.status,
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-                node.duration_ms,
-                1,
-                2,
-                0,
-                0,
-                None,
-                node.status_reason,
-                None,
-                None,
-                node.error_message,
-                0,
-                notes_payload,
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-            )
+            scenario.run_id,
+            node.parent_execution_id,
+            2,
+            1,
+            "status_changed",
+            node.status,
+            node.status_reason,
+            EVENT_COMPLETED_PAYLOAD
+            if node.status != "failed"
+            else EVENT_FAILED_PAYLOAD,
+            node.completed_iso,
+            node.completed_iso,
         )
 
-        event_rows.extend(
-            [
-                (
-                    node.execution_id,
-                    scenario.workflow_id,
-                    scenario.run_id,
-                    node.parent_execution_id,
-                    1,
-                    0,
-                    "status_changed",
-                    "running",
-                    None,
-                    json.dumps({"detail": "Execution started"}),
-                    isoformat(node.started_at),
-                    isoformat(node.started_at),
-                ),
-                (
-                    node.execution_id,
-                    scenario.workflow_id,
-                    scenario.run_id,
-                    node.parent_execution_id,
-                    2,
-                    1,
-                    "status_changed",
-                    node.status,
-                    node.status_reason,
-                    json.dumps(
-                        {
-                            "detail": "Execution completed"
-                            if node.status != "failed"
-                            else "Execution failed"
-                        }
-                    ),
-                    isoformat(node.completed_at),
-                    isoformat(node.completed_at),
-                ),
-            ]
-        )
 
-        step_id = f"step_{uuid.uuid4().hex[:14]}"
-        step_lookup[node.execution_id] = step_id
-        parent_step_id = (
-            step_lookup.get(node.parent_execution_id)
-            if node.parent_execution_id
-            else None
-        )
-        step_rows.append(
-            (
-                step_id,
-                scenario.run_id,
-                parent_step_id,
-                node.execution_id,
-                node.agent_node_id,
-                f"agent://{node.agent_node_id}",
-                "succeeded" if node.status.startswith("succeeded") else node.status,
-                1,
-                random.randint(0, 4),
-                isoformat(node.started_at),
-                None,
-                None,
-                node.error_message,
-                b"{}",
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-                None,
-                None,
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-            )
+def _iter_step_rows(
+    scenario: WorkflowScenario, nodes: Sequence[NodeRecord], priorities: Sequence[int]
+) -> Iterator[tuple]:
+    step_ids = [f"step_{suffix}" for suffix in mint_hex_ids(len(nodes), 14)]
+    for node, step_id, priority in zip(nodes, step_ids, priorities):
+        yield (
+            step_id,
+            scenario.run_id,
+            step_ids[node.parent_index] if node.parent_index is not None else None,
+            node.execution_id,
+            node.agent_node_id,
+            f"agent://{node.agent_node_id}",
+            "succeeded" if node.status.startswith("succeeded") else node.status,
+            1,
+            priority,
+            node.started_iso,
+            None,
+            None,
+            node.error_message,
+            EMPTY_JSON_BLOB,
+            node.started_iso,
+            node.completed_iso,
+            None,
+            None,
+            node.started_iso,
+            node.completed_iso,
         )
 
-        execution_rows_simple.append(
-            (
-                node.execution_id,
-                scenario.run_id,
-                node.parent_execution_id,
-                node.agent_node_id,
-                node.reasoner_id,
-                node.agent_node_id,
-                node.status,
-                json.dumps(node.input_payload).encode(),
-                json.dumps(node.output_payload).encode(),
-                node.error_message,
-                None,
-                None,
-                scenario.session_id,
-                scenario.actor_id,
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-                node.duration_ms,
-                isoformat(node.started_at),
-                isoformat(node.completed_at),
-            )
+
+@dataclass
+class WorkflowRows:
+    """Every row seeded for one workflow, grouped by table.
+
+    The per-node tables are lazy generators when built in-process and lists
+    once ``materialized`` for shipping back from a worker process.
+    """
+
+    scenario: WorkflowScenario
+    node_count: int
+    workflow: tuple
+    run: tuple
+    executions: Iterable[tuple]
+    execution_events: Iterable[tuple]
+    steps: Iterable[tuple]
+    run_events: Sequence[tuple]
+
+    def materialized(self) -> "WorkflowRows":
+        # Consume the generators in the same order insert_workflow_rows does.
+        return replace(
+            self,
+            executions=list(self.executions),
+            execution_events=list(self.execution_events),
+            steps=list(self.steps),
         )
 
-    placeholders = ",".join("?" for _ in execution_rows[0])
-    conn.executemany(
-        f"""
-        INSERT INTO workflow_executions (
-            workflow_id, execution_id, agentfield_request_id, run_id, session_id,
-            actor_id, agent_node_id, parent_workflow_id, parent_execution_id,
-            root_workflow_id, workflow_depth, reasoner_id, input_data, output_data,
-            input_size, output_size, workflow_name, workflow_tags, status,
-            started_at, completed_at, duration_ms, state_version, last_event_sequence,
-            active_children, pending_children, pending_terminal_status, status_reason,
-            lease_owner, lease_expires_at, error_message, retry_count, notes, created_at,
-            updated_at
-        ) VALUES ({placeholders})
-        """,
-        execution_rows,
-    )
 
-    conn.executemany(
-        """
-        INSERT INTO workflow_execution_events (
-            execution_id, workflow_id, run_id, parent_execution_id, sequence,
-            previous_sequence, event_type, status, status_reason, payload,
-            emitted_at, recorded_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        event_rows,
+def build_workflow_rows(
+    scenario: WorkflowScenario, nodes: Sequence[NodeRecord]
+) -> WorkflowRows:
+    total_executions = len(nodes)
+    success_count = sum(1 for n in nodes if n.status == "succeeded")
+    failed_count = total_executions - success_count
+    max_depth = max(n.depth for n in nodes)
+    workflow_status = "succeeded" if failed_count == 0 else "failed"
+    first_started = min(n.started_epoch for n in nodes)
+    last_completed = max(n.completed_epoch for n in nodes)
+    total_duration_ms = (last_completed - first_started) * 1000
+    scenario_started_iso = isoformat(scenario.started_at)
+    last_completed_iso = isoformat_epoch(last_completed)
+    now_iso = isoformat(datetime.utcnow())
+    tags_json = dumps_json(scenario.workflow_tags).decode()
+
+    workflow_row = (
+        scenario.workflow_id,
+        scenario.workflow_name,
+        tags_json,
+        scenario.session_id,
+        scenario.actor_id,
+        None,
+        None,
+        scenario.workflow_id,
+        max_depth,
+        total_executions,
+        success_count,
+        failed_count,
+        total_duration_ms,
+        workflow_status,
+        isoformat_epoch(first_started),
+        last_completed_iso,
+        scenario_started_iso,
+        now_iso,
     )
 
-    conn.executemany(
-        """
-        INSERT INTO workflow_steps (
-            step_id, run_id, parent_step_id, execution_id, agent_node_id, target,
-            status, attempt, priority, not_before, input_uri, result_uri, error_message,
-            metadata, started_at, completed_at, leased_at, lease_timeout, created_at,
-            updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        step_rows,
+    run_metadata = {
+        "objective": scenario.workflow_name,
+        "deliverable": random.choice(DELIVERABLES),
+        "regions": list({scenario.workflow_tags[2]}),
+    }
+    run_row = (
+        scenario.run_id,
+        scenario.workflow_id,
+        scenario.root_execution_id,
+        workflow_status,
+        total_executions,
+        success_count,
+        failed_count,
+        3,
+        3,
+        dumps_json(run_metadata),
+        scenario_started_iso,
+        now_iso,
+        last_completed_iso,
     )
 
+    checkpoint_iso = isoformat(scenario.started_at + timedelta(minutes=9))
     run_events = [
         (
             scenario.run_id,
@@ -964,9 +1170,9 @@ def insert_workflow(
             "run_started",
             "running",
             None,
-            json.dumps({"kickoff": "approved"}),
-            isoformat(scenario.started_at),
-            isoformat(scenario.started_at),
+            RUN_STARTED_PAYLOAD,
+            scenario_started_iso,
+            scenario_started_iso,
         ),
         (
             scenario.run_id,
@@ -975,9 +1181,9 @@ def insert_workflow(
             "run_checkpoint",
             "running",
             None,
-            json.dumps({"progress": 0.55}),
-            isoformat(scenario.started_at + timedelta(minutes=9)),
-            isoformat(scenario.started_at + timedelta(minutes=9)),
+            RUN_CHECKPOINT_PAYLOAD,
+            checkpoint_iso,
+            checkpoint_iso,
         ),
         (
             scenario.run_id,
@@ -986,72 +1192,196 @@ def insert_workflow(
             "run_completed",
             workflow_status,
             None,
-            json.dumps({"deliverable": random.choice(DELIVERABLES)}),
-            isoformat(max(n.completed_at for n in nodes)),
-            isoformat(max(n.completed_at for n in nodes)),
+            RUN_COMPLETED_PAYLOADS[random.choice(DELIVERABLES)],
+            last_completed_iso,
+            last_completed_iso,
         ),
     ]
-    conn.executemany(
-        """
-        INSERT INTO workflow_run_events (
-            run_id, sequence, previous_sequence, event_type, status,
-            status_reason, payload, emitted_at, recorded_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        run_events,
-    )
 
-    conn.executemany(
-        """
-        INSERT INTO executions (
-            execution_id, run_id, parent_execution_id, agent_node_id, reasoner_id,
-            node_id, status, input_payload, result_payload, error_message,
-            input_uri, result_uri, session_id, actor_id, started_at, completed_at,
-            duration_ms, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        execution_rows_simple,
+    # Drawn up front so the random stream does not depend on when the lazy
+    # step rows are consumed.
+    step_priorities = randints(0, 4, len(nodes))
+
+    return WorkflowRows(
+        scenario=scenario,
+        node_count=total_executions,
+        workflow=workflow_row,
+        run=run_row,
+        executions=_iter_execution_rows(scenario, nodes, tags_json),
+        execution_events=_iter_event_rows(scenario, nodes),
+        steps=_iter_step_rows(scenario, nodes, step_priorities),
+        run_events=run_events,
     )
 
 
-def seed_database(args: argparse.Namespace) -> List[Tuple[str, str, int]]:
+def insert_workflow_rows(conn: sqlite3.Connection, rows: WorkflowRows) -> None:
+    # executemany pulls one row at a time from the generators, so handing it
+    # the whole table keeps memory flat; slicing into fixed-size batches
+    # measured no faster.
+    conn.execute(WORKFLOW_INSERT_SQL, rows.workflow)
+    conn.execute(WORKFLOW_RUN_INSERT_SQL, rows.run)
+    conn.executemany(WORKFLOW_EXECUTION_INSERT_SQL, rows.executions)
+    conn.executemany(WORKFLOW_EXECUTION_EVENT_INSERT_SQL, rows.execution_events)
+    # Steps reference their parent step, and nodes list every parent before
+    # its children, so rows can be streamed in order.
+    conn.executemany(WORKFLOW_STEP_INSERT_SQL, rows.steps)
+    conn.executemany(WORKFLOW_RUN_EVENT_INSERT_SQL, rows.run_events)
+    conn.execute(EXECUTION_INSERT_SQL, (rows.scenario.run_id,))
+
+
+def build_workflow(
+    args: argparse.Namespace, wf_index: int, base_start: datetime
+) -> WorkflowRows:
+    """Synthesize workflow ``wf_index`` and build its rows.
+
+    With ``--seed`` each workflow reseeds from (seed, index), so its contents
+    do not depend on which process builds it or in what order.
+    """
     if args.seed is not None:
-        random.seed(args.seed)
+        random.seed(f"{args.seed}:{wf_index}")
+    scenario = generate_scenario(
+        prefix=args.workflow_prefix,
+        session_prefix=args.session_prefix,
+        actor_pool=args.actor_pool,
+        idx=wf_index,
+        started_at=base_start + timedelta(minutes=wf_index * args.stagger_minutes),
+        nodes_per_workflow=args.nodes_per_workflow,
+    )
+    nodes = synthesize_nodes(scenario, nodes_per_workflow=args.nodes_per_workflow)
+    return build_workflow_rows(scenario, nodes)
 
-    db_path = args.db_path.expanduser()
-    if not db_path.exists():
-        raise FileNotFoundError(
-            f"SQLite database not found at {db_path}. Start the control plane once to create it."
-        )
 
-    with sqlite3.connect(db_path) as conn:
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("BEGIN")
+def _build_workflow_in_worker(
+    args: argparse.Namespace, wf_index: int, base_start: datetime
+) -> WorkflowRows:
+    return build_workflow(args, wf_index, base_start).materialized()
 
-        ensure_agent_nodes(conn, args.team_id)
-        if args.purge_prefix:
-            purge_workflows_with_prefix(conn, args.workflow_prefix)
 
-        inserted: List[Tuple[str, str, int]] = []
-        base_start = datetime.utcnow() - timedelta(hours=args.start_hours_ago)
+def build_workflows(
+    args: argparse.Namespace, base_start: datetime
+) -> Iterator[WorkflowRows]:
+    """Yield every workflow's rows in index order.
+
+    With ``--workers`` above 1, synthesis and serialization fan out over a
+    process pool while the caller, which alone holds the SQLite connection,
+    writes finished workflows. At most ``workers`` finished workflows wait
+    in memory ahead of the writer.
+
+    Processes rather than a producer thread: row building is pure Python and
+    needs the GIL, which ``executemany`` takes back after every row it steps,
+    so a thread feeding the writer only adds contention.
+    """
+    if args.workers <= 1:
+        for wf_index in range(args.workflow_count):
+            yield build_workflow(args, wf_index, base_start)
+        return
 
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        pending: Deque[Future] = deque()
         for wf_index in range(args.workflow_count):
-            scenario = generate_scenario(
-                prefix=args.workflow_prefix,
-                session_prefix=args.session_prefix,
-                actor_pool=args.actor_pool,
-                idx=wf_index,
-                started_at=base_start
-                + timedelta(minutes=wf_index * args.stagger_minutes),
-                nodes_per_workflow=args.nodes_per_workflow,
+            pending.append(
+                pool.submit(_build_workflow_in_worker, args, wf_index, base_start)
             )
-            nodes = synthesize_nodes(
-                scenario, nodes_per_workflow=args.nodes_per_workflow
+            if len(pending) > args.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def open_stage(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Attach an in-memory ``stage`` database to ``conn`` and connect to it.
+
+    The stage gets empty copies of the seeded tables, taken from the target
+    database's own schema; build rows into the returned connection and copy
+    them over with ``merge_stage``.
+    """
+    uri = f"file:agentfield_seed_stage_{os.getpid()}?mode=memory&cache=shared"
+    stage = sqlite3.connect(uri, uri=True, isolation_level=None)
+    placeholders = ",".join("?" * len(SEEDED_TABLES))
+    for (sql,) in conn.execute(
+        f"SELECT sql FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+        SEEDED_TABLES,
+    ):
+        stage.execute(sql)
+    conn.execute("ATTACH DATABASE ? AS stage", (uri,))
+    return stage
+
+
+def merge_stage(conn: sqlite3.Connection) -> None:
+    """Copy every staged row into the main database.
+
+    INTEGER PRIMARY KEY columns are left out so the target assigns its own
+    rowids after the rows it already holds.
+    """
+    for table in SEEDED_TABLES:
+        columns = ", ".join(
+            name
+            for _, name, column_type, _, _, pk in conn.execute(
+                f"PRAGMA stage.table_info({table})"
             )
-            insert_workflow(conn, scenario, nodes)
-            inserted.append((scenario.workflow_id, scenario.run_id, len(nodes)))
+            if not (pk and column_type.upper() == "INTEGER")
+        )
+        conn.execute(
+            f"INSERT INTO main.{table} ({columns}) SELECT {columns} FROM stage.{table}"
+        )
+
+
+def insert_workflows(
+    conn: sqlite3.Connection, args: argparse.Namespace, base_start: datetime
+) -> List[Tuple[str, str, int]]:
+    inserted: List[Tuple[str, str, int]] = []
+    for rows in build_workflows(args, base_start):
+        insert_workflow_rows(conn, rows)
+        inserted.append(
+            (rows.scenario.workflow_id, rows.scenario.run_id, rows.node_count)
+        )
+    return inserted
 
-        conn.commit()
+
+def seed_database(args: argparse.Namespace) -> List[Tuple[str, str, int]]:
+    db_path = args.db_path.expanduser()
+    if not db_path.exists():
+        raise FileNotFoundError(
+            f"SQLite database not found at {db_path}. Start the control plane once to create it."
+        )
+
+    # Autocommit mode: the whole run is one explicit transaction, so every
+    # row reaches disk with a single commit. Opened by URI so the in-memory
+    # stage can be attached by URI too.
+    conn = sqlite3.connect(db_path.resolve().as_uri(), uri=True, isolation_level=None)
+    stage: Optional[sqlite3.Connection] = None
+    try:
+        configure_connection(conn)
+        base_start = datetime.utcnow() - timedelta(hours=args.start_hours_ago)
+
+        if args.in_memory_build:
+            stage = open_stage(conn)
+            stage.execute("BEGIN")
+            inserted = insert_workflows(stage, args, base_start)
+            stage.execute("COMMIT")
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            ensure_agent_nodes(conn, args.team_id)
+            if args.purge_prefix:
+                purge_workflows_with_prefix(conn, args.workflow_prefix)
+
+            if stage is None:
+                inserted = insert_workflows(conn, args, base_start)
+            else:
+                merge_stage(conn)
+
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if stage is not None:
+            conn.execute("DETACH DATABASE stage")
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+        if stage is not None:
+            stage.close()
 
     return inserted
 
@@ -1064,6 +1394,9 @@ def main(argv: Sequence[str]) -> int:
     if args.workflow_count <= 0:
         print("workflow-count must be positive.", file=sys.stderr)
         return 1
+    if args.workers <= 0:
+        print("workers must be positive.", file=sys.stderr)
+        return 1
     if args.dry_run:
         print("Dry-run mode currently not implemented. Remove --dry-run to write data.")
         return 0
@@ -1,6 +1,7 @@
 import json
 import os
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 import requests
@@ -31,6 +32,30 @@ except Exception:  # pragma: no cover - test environments may not have openai
     openai = _OpenAIStub()  # type: ignore
 
 
+@lru_cache(maxsize=128)
+def _schema_instruction(schema: Type[BaseModel]) -> str:
+    """System-prompt instruction embedding ``schema``'s JSON schema.
+
+    Schema classes are fixed once defined, so the JSON schema is generated
+    and serialized once per class rather than on every ``ai()`` call.
+    """
+    # Generate a readable JSON schema string using the modern Pydantic API
+    try:
+        schema_dict = schema.model_json_schema()
+        schema_json = json.dumps(schema_dict, indent=2)
+    except Exception:
+        schema_json = str(schema)
+    return (
+        "IMPORTANT: You must exactly adhere to the output schema provided below. "
+        "Do not add or omit any fields. Output must be valid JSON matching the schema. "
+        "If a field is required in the schema, it must be present in the output. "
+        "If a field is not in the schema, do NOT include it in the output. "
+        "Here is the output schema you must follow:\n"
+        f"{schema_json}\n"
+        "Repeat: Output ONLY valid JSON matching the schema above. Do not include any extra text or explanation."
+    )
+
+
 class AgentAI:
     """AI/LLM Integration functionality for AgentField Agent"""
 
@@ -219,21 +244,7 @@ class AgentAI:
 
         # If a schema is provided, augment the system prompt with strict schema adherence instructions and schema context
         if schema:
-            # Generate a readable JSON schema string using the modern Pydantic API
-            try:
-                schema_dict = schema.model_json_schema()
-                schema_json = json.dumps(schema_dict, indent=2)
-            except Exception:
-                schema_json = str(schema)
-            schema_instruction = (
-                "IMPORTANT: You must exactly adhere to the output schema provided below. "
-                "Do not add or omit any fields. Output must be valid JSON matching the schema. "
-                "If a field is required in the schema, it must be present in the output. "
-                "If a field is not in the schema, do NOT include it in the output. "
-                "Here is the output schema you must follow:\n"
-                f"{schema_json}\n"
-                "Repeat: Output ONLY valid JSON matching the schema above. Do not include any extra text or explanation."
-            )
+            schema_instruction = _schema_instruction(schema)
             # Merge with any user-provided system prompt
             if system:
                 system_prompt = f"{system}\n\n{schema_instruction}"
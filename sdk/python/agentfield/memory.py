@@ -353,6 +353,38 @@ class MemoryClient:
         response.raise_for_status()
         return response.json()
 
+    async def similarity_search_batch(
+        self,
+        query_embeddings: Sequence[Union[Sequence[float], Any]],
+        top_k: int = 10,
+        scope: Optional[str] = None,
+        scope_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches in a single request.
+
+        Returns one result list per query embedding, in the same order.
+        """
+        headers = self._build_headers(scope, scope_id)
+        payload: Dict[str, Any] = {
+            "query_embeddings": [_vector_to_list(q) for q in query_embeddings],
+            "top_k": top_k,
+            "filters": filters or {},
+        }
+        if scope:
+            payload["scope"] = scope
+
+        response = await self._async_request(
+            "POST",
+            f"{self.agentfield_client.api_base}/memory/vector/search/batch",
+            json=payload,
+            headers=headers,
+            timeout=15.0,
+        )
+        response.raise_for_status()
+        return response.json()
+
 
 class ScopedMemoryClient:
     """
@@ -442,6 +474,21 @@ class ScopedMemoryClient:
             filters=filters,
         )
 
+    async def similarity_search_batch(
+        self,
+        query_embeddings: Sequence[Union[Sequence[float], Any]],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several vector searches within this scope in one request."""
+        return await self.memory_client.similarity_search_batch(
+            query_embeddings,
+            top_k=top_k,
+            scope=self.scope,
+            scope_id=self.scope_id,
+            filters=filters,
+        )
+
     def on_change(self, patterns: Union[str, List[str]]):
         """
         Decorator for subscribing to memory change events in this scope.
@@ -524,6 +571,17 @@ class GlobalMemoryClient:
             query_embedding, top_k=top_k, scope="global", filters=filters
         )
 
+    async def similarity_search_batch(
+        self,
+        query_embeddings: Sequence[Union[Sequence[float], Any]],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several vector searches in global scope in one request."""
+        return await self.memory_client.similarity_search_batch(
+            query_embeddings, top_k=top_k, scope="global", filters=filters
+        )
+
     def on_change(self, patterns: Union[str, List[str]]) -> Callable:
         """
         Decorator for subscribing to global-scope memory change events.
@@ -660,6 +718,19 @@ class MemoryInterface:
             query_embedding, top_k=top_k, filters=filters
         )
 
+    async def similarity_search_batch(
+        self,
+        query_embeddings: Sequence[Union[Sequence[float], Any]],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several similarity searches in one request, one result list per query.
+        """
+        return await self.memory_client.similarity_search_batch(
+            query_embeddings, top_k=top_k, filters=filters
+        )
+
     def on_change(self, patterns: Union[str, List[str]]):
         """
         Decorator for subscribing to memory change events.
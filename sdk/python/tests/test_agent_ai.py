@@ -100,6 +100,29 @@ def test_get_rate_limiter_cached(monkeypatch, agent_with_ai):
     assert created["max_retries"] == agent_with_ai.ai_config.rate_limit_max_retries
 
 
+def test_schema_instruction_cached(monkeypatch):
+    from pydantic import BaseModel
+
+    from agentfield.agent_ai import _schema_instruction
+
+    class Answer(BaseModel):
+        text: str
+
+    calls = []
+    original = Answer.model_json_schema
+
+    def counting_schema(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(Answer, "model_json_schema", counting_schema)
+
+    first = _schema_instruction(Answer)
+    assert _schema_instruction(Answer) is first
+    assert '"text"' in first
+    assert len(calls) == 1
+
+
 @pytest.mark.asyncio
 async def test_ensure_model_limits_cached(monkeypatch, agent_with_ai):
     calls = []
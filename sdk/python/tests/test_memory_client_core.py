@@ -217,6 +217,38 @@ async def test_similarity_search_returns_results(memory_client, monkeypatch):
     assert result == expected
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_similarity_search_batch_posts_all_queries(memory_client, monkeypatch):
+    expected = [[{"key": "chunk_1", "score": 0.9}], []]
+    captured = {}
+
+    class DummyResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return expected
+
+    async def fake_request(method, url, json=None, headers=None, timeout=None):  # type: ignore[override]
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse()
+
+    monkeypatch.setattr(memory_client, "_async_request", fake_request)
+
+    result = await memory_client.similarity_search_batch(
+        [[0.5, 0.2], (0.1, 0.3)], top_k=4, filters={"namespace": "docs"}
+    )
+    assert result == expected
+    assert captured["url"].endswith("/memory/vector/search/batch")
+    assert captured["json"] == {  # type: ignore[comparison-overlap]
+        "query_embeddings": [[0.5, 0.2], [0.1, 0.3]],
+        "top_k": 4,
+        "filters": {"namespace": "docs"},
+    }
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_list_keys_returns_names(memory_client, monkeypatch):
@@ -318,6 +350,7 @@ async def test_global_client_delegates(memory_client):
     base.set_vector = AsyncMock()  # type: ignore[assignment]
     base.delete_vector = AsyncMock()  # type: ignore[assignment]
     base.similarity_search = AsyncMock(return_value=[{"key": "chunk"}])  # type: ignore[assignment]
+    base.similarity_search_batch = AsyncMock(return_value=[[{"key": "chunk"}]])  # type: ignore[assignment]
 
     global_client = GlobalMemoryClient(base)
 
@@ -329,6 +362,7 @@ async def test_global_client_delegates(memory_client):
     await global_client.set_vector("chunk", [0.2])
     await global_client.delete_vector("chunk")
     await global_client.similarity_search([0.3])
+    await global_client.similarity_search_batch([[0.3]])
 
     base.set.assert_awaited_once_with("key", 1, scope="global")
     base.get.assert_awaited_once_with("key", default=None, scope="global")
@@ -342,6 +376,9 @@ async def test_global_client_delegates(memory_client):
     base.similarity_search.assert_awaited_once_with(
         [0.3], top_k=10, scope="global", filters=None
     )
+    base.similarity_search_batch.assert_awaited_once_with(
+        [[0.3]], top_k=10, scope="global", filters=None
+    )
 
 
 @pytest.mark.unit